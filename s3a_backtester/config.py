@@ -8,14 +8,28 @@ Acts as the single source of truth for all strategy parameters.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
 import yaml
 
 from s3a_backtester.validator import validate_keys
 
 
+@lru_cache(maxsize=64)
+def parse_clock_ns(value: str) -> int:
+    """
+    Parses an 'HH:MM[:SS]' clock string into nanoseconds since midnight.
+    Cached: the same handful of window strings are parsed on every run.
+    """
+    t: time = pd.Timestamp(value).time()
+    secs = t.hour * 3600 + t.minute * 60 + t.second
+    return (secs * 1_000_000 + t.microsecond) * 1_000
+
+
 @dataclass
 class EntryWindow:
     """Defines the active trading hours (ET) for signal acceptance."""
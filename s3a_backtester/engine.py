@@ -7,51 +7,160 @@ Includes the primary State Machine (Unlock -> Zone -> Trigger) and Trade Builder
 
 from __future__ import annotations
 
-from datetime import date
-from typing import Any, Literal, cast
+from typing import Any, NamedTuple, cast
 
 import numpy as np
 import pandas as pd
 
-from .config import Config, MgmtCfg, TimeStopCfg
+from .config import Config, MgmtCfg, TimeStopCfg, parse_clock_ns
 from .filters import build_session_filter_mask
-from .management import manage_trade_lifecycle
-from .slippage import apply_slippage
+from .management import SessionArrays, manage_trade_lifecycle
+from .sessions import session_cumsum, session_starts, wall_day_tod
+from .slippage import apply_slippage_vec
 from .time_stop_conditions import build_time_stop_condition_series
 
-_TRADE_COLS = [
-    "date",
-    "signal_time",
-    "entry_time",
-    "exit_time",
-    "side",
-    "entry",
-    "stop",
-    "tp1",
-    "tp2",
-    "or_height",
-    "sl_ticks",
-    "risk_R",
-    "realized_R",
-    "t_to_tp1_min",
-    "trigger_type",
-    "location",
-    "time_stop",
-    "disqualifier",
-    "slippage_entry_ticks",
-    "slippage_exit_ticks",
-]
+# Trade labels are computed as small int codes and stored as categoricals.
+_TRIGGER_LABELS = ["unknown", "swingbreak", "engulf"]
+_LOCATION_LABELS = ["none", "vwap", "+1sigma", "-1sigma"]
+
+_TRADE_SCHEMA: dict[str, Any] = {
+    "date": "object",
+    "signal_time": "object",
+    "entry_time": "object",
+    "exit_time": "object",
+    "side": "object",
+    "entry": "float64",
+    "stop": "float64",
+    "tp1": "float64",
+    "tp2": "float64",
+    "or_height": "float64",
+    "sl_ticks": "float64",
+    "risk_R": "float64",
+    "realized_R": "float64",
+    "t_to_tp1_min": "float64",
+    "trigger_type": pd.CategoricalDtype(_TRIGGER_LABELS),
+    "location": pd.CategoricalDtype(_LOCATION_LABELS),
+    "time_stop": "object",
+    "disqualifier": "object",
+    "slippage_entry_ticks": "float64",
+    "slippage_exit_ticks": "float64",
+}
+_TRADE_COLS = list(_TRADE_SCHEMA)
+
+# Timestamp columns stay `object` here: their tz is only known once real
+# trades exist, and a naive datetime64 template would not concat cleanly.
+_EMPTY_TRADES = pd.DataFrame(
+    {c: pd.Series(dtype=dt) for c, dt in _TRADE_SCHEMA.items()}
+)
+
+
+class _SignalParams(NamedTuple):
+    """Scalar config values consumed by `generate_signals`, resolved once."""
+
+    tick_size: float
+    entry_start_ns: int | None
+    entry_end_ns: int | None
+    disqualify_after_unlock: bool
+    zone_touch_mode: str
+    trigger_lookback: int
+
+
+def _resolve_signal_params(cfg: Any | None) -> _SignalParams:
+    """Walks the (possibly duck-typed) config once and returns plain scalars."""
+    ew = getattr(cfg, "entry_window", None) if cfg is not None else None
+    if ew is None:
+        start_ns: int | None = None
+        end_ns: int | None = None
+    else:
+        start_ns = parse_clock_ns(getattr(ew, "start", "09:35"))
+        end_ns = parse_clock_ns(getattr(ew, "end", "11:00"))
+
+    rules = getattr(cfg, "signals", None) if cfg is not None else None
+    lookback = int(getattr(rules, "trigger_lookback_bars", 2))
+
+    tick_size = 1.0
+    inst = getattr(cfg, "instrument", None) if cfg is not None else None
+    tick_size = float(getattr(inst, "tick_size", tick_size) or tick_size)
+    slip = getattr(cfg, "slippage", None) if cfg is not None else None
+    if slip is not None:
+        tick_size = float(getattr(slip, "tick_size", tick_size) or tick_size)
+
+    return _SignalParams(
+        tick_size=tick_size,
+        entry_start_ns=start_ns,
+        entry_end_ns=end_ns,
+        disqualify_after_unlock=bool(getattr(rules, "disqualify_after_unlock", False)),
+        zone_touch_mode=str(getattr(rules, "zone_touch_mode", "close")).lower(),
+        trigger_lookback=max(0, min(lookback, 10)),
+    )
+
+
+def _session_codes(idx: pd.DatetimeIndex) -> np.ndarray:
+    """Compact int32 session key (YYYYMMDD) for each bar of a local-time index."""
+    codes: np.ndarray = (idx.year * 10000 + idx.month * 100 + idx.day).to_numpy(
+        dtype=np.int32
+    )
+    return codes
+
+
+def _session_shift(x: np.ndarray, k: int, starts: np.ndarray) -> np.ndarray:
+    """
+    Shifts a bool array forward by `k` rows without crossing session starts.
+    Equivalent to `groupby(session).shift(k, fill_value=False)`.
+    """
+    n = len(x)
+    out = np.zeros(n, dtype=bool)
+    if k >= n or len(starts) == 0:
+        return out
+    out[k:] = x[:-k] if k > 0 else x
+    lengths = np.diff(np.append(starts, n))
+    pos_in_session = np.arange(n) - np.repeat(starts, lengths)
+    out[pos_in_session < k] = False
+    return out
+
+
+def _bool_col(df: pd.DataFrame, col: str, default: bool = False) -> np.ndarray:
+    """
+    Reads a flag column as a plain NumPy bool array (NA -> False).
+    Guards against nullable `boolean` / object columns leaking into mask math.
+    """
+    if col not in df.columns:
+        return np.full(len(df), default, dtype=bool)
+    flags: np.ndarray = df[col].to_numpy(dtype=bool, na_value=False)
+    return flags
+
+
+def _f64(values: Any) -> np.ndarray:
+    """
+    Materialises a column as a C-contiguous float64 array for the numeric block.
+    No-op copy-wise when the input is already contiguous float64.
+    """
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _dir_col(df: pd.DataFrame, col: str, pos: np.ndarray | None = None) -> np.ndarray:
+    """
+    Reads a +1/0/-1 direction column as int8 (missing/NaN/unparseable -> 0).
+    With `pos`, only those rows are gathered and coerced.
+    """
+    if col not in df.columns:
+        return np.zeros(len(df) if pos is None else len(pos), dtype=np.int8)
+    raw = df[col] if pos is None else df[col].iloc[pos]
+    vals = pd.to_numeric(raw, errors="coerce")
+    dirs: np.ndarray = vals.to_numpy(dtype=np.int8, na_value=0)
+    return dirs
 
 
 def simulate_trades(
     df1: pd.DataFrame, signals: pd.DataFrame, cfg: Config | None
 ) -> pd.DataFrame:
     """
-    Iterates through signal events to build executed trades.
-    Applies slippage, risk checks, and full lifecycle management.
+    Builds executed trades from signal events.
+    Fill pricing, slippage, risk checks and labels are computed column-wise;
+    only the path-dependent lifecycle management runs per trade.
     """
     if signals is None or signals.empty:
-        return pd.DataFrame(columns=_TRADE_COLS)
+        return _EMPTY_TRADES.copy()
 
     mkt = df1
     sig = signals
@@ -69,7 +178,6 @@ def simulate_trades(
 
     mkt_idx: pd.DatetimeIndex = mkt.index
 
-    df = sig.copy()
     defaults: dict[str, object] = {
         "direction": 0,
         "trigger_ok": False,
@@ -89,26 +197,33 @@ def simulate_trades(
         "news_blackout": False,
         "dom_bad": False,
     }
-    for col, val in defaults.items():
-        if col not in df:
-            df[col] = cast(Any, val)
-
-    direction = pd.to_numeric(df["direction"], errors="coerce").fillna(0).astype(int)
-    mask = (
-        direction.ne(0)
-        & df["trigger_ok"].astype(bool)
-        & df["time_window_ok"].astype(bool)
-        & ~df["disqualified_2sigma"].astype(bool)
-    )
+    # Missing inputs are added in one `assign` (no full copy when none are).
+    missing = {c: v for c, v in defaults.items() if c not in sig.columns}
+    df = sig.assign(**missing) if missing else sig
+
+    direction = _dir_col(df, "direction")
+
+    # Entry mask: one bool buffer narrowed in place, no intermediate Series.
+    m = direction != 0
+    m &= _bool_col(df, "trigger_ok")
+    m &= _bool_col(df, "time_window_ok")
+    m &= ~_bool_col(df, "disqualified_2sigma")
 
     filters_cfg = getattr(cfg, "filters", None) if cfg is not None else None
     if filters_cfg is not None:
         session_mask = build_session_filter_mask(df, filters_cfg)
-        mask &= session_mask
+        m &= session_mask.to_numpy(dtype=bool)
+
+    # Candidates are addressed by position; columns are pulled as ndarrays
+    # on demand instead of materializing a masked copy of the frame. Only the
+    # masked-in rows are gathered, so no full-length conversion runs past here.
+    entry_pos = np.flatnonzero(m)
+    if len(entry_pos) == 0:
+        return _EMPTY_TRADES.copy()
+    n_cand = len(entry_pos)
 
-    entries = df.loc[mask].copy()
-    if entries.empty:
-        return pd.DataFrame(columns=_TRADE_COLS)
+    def _take(col: str, pos: np.ndarray) -> np.ndarray:
+        return _f64(df[col].to_numpy()[pos])
 
     tick_size = 0.25
     mgmt_cfg: MgmtCfg | None = None
@@ -138,182 +253,197 @@ def simulate_trades(
     tick_size = float(tick_size) if tick_size else 0.25
     use_management = mgmt_cfg is not None and time_cfg is not None
 
-    entry_pos = mkt_idx.get_indexer(cast(pd.DatetimeIndex, entries.index))
     mkt_len = len(mkt)
 
-    records: list[dict[str, object]] = []
-    session_cache: dict[date, pd.DataFrame] = {}
+    # --- Vectorized entry pricing, risk gating and labelling -------------
+    dir_arr = direction[m]
+    side_sign_arr = np.where(dir_arr > 0, np.int8(1), np.int8(-1))
 
-    feature_cols_needed = (
-        "vwap",
-        "vwap_1u",
-        "vwap_1d",
-        "vwap_2u",
-        "vwap_2d",
-        "trend_5m",
-        "trend_dir_5m",
-        "trend5",
-        "trend_dir",
-        "trend5_dir",
+    if "close" in mkt.columns:
+        close_at_signal = mkt["close"].to_numpy(dtype=float)[entry_pos]
+    elif "close" in df.columns:
+        close_at_signal = _take("close", entry_pos)
+    else:
+        close_at_signal = np.full(n_cand, np.nan)
+
+    fill_pos = entry_pos.copy()
+    raw_price_arr = close_at_signal.copy()
+    if fill_mode == "next_open" and "open" in mkt.columns:
+        has_next = entry_pos + 1 < mkt_len
+        fill_pos[has_next] += 1
+        raw_price_arr[has_next] = mkt["open"].to_numpy(dtype=float)[fill_pos[has_next]]
+    fill_ts_idx = mkt_idx[fill_pos]
+
+    stop_arr = pd.to_numeric(
+        df["stop_price"].iloc[entry_pos], errors="coerce"
+    ).to_numpy(dtype=float, na_value=np.nan)
+
+    valid = np.isfinite(raw_price_arr) & np.isfinite(stop_arr)
+    entry_price_arr: np.ndarray = np.full(n_cand, np.nan)
+    entry_price_arr[valid] = apply_slippage_vec(
+        side_sign_arr[valid], fill_ts_idx[valid], raw_price_arr[valid], cfg
     )
 
-    for (_ts, row), pos in zip(entries.iterrows(), entry_pos):
-        pos_i = int(pos)
-        if pos_i < 0:
-            continue
-
-        ts_idx: pd.Timestamp = mkt_idx[pos_i]
-
-        dir_val = int(row["direction"])
-        if dir_val == 0:
-            continue
-
-        side_lit: Literal["long", "short"] = "long" if dir_val > 0 else "short"
-        side_sign = 1 if dir_val > 0 else -1
-
-        raw_price: float
-        fill_ts: pd.Timestamp = ts_idx
-
-        if fill_mode == "next_open":
-            next_pos = pos_i + 1
-            if "open" in mkt.columns and next_pos < mkt_len:
-                raw_price = float(mkt["open"].iloc[next_pos])
-                fill_ts = mkt_idx[next_pos]
-            else:
-                if "close" in mkt.columns:
-                    raw_price = float(mkt["close"].iloc[pos_i])
-                else:
-                    raw_price = float(row.get("close", np.nan))
-                fill_ts = ts_idx
-        else:
-            if "close" in mkt.columns:
-                raw_price = float(mkt["close"].iloc[pos_i])
-            else:
-                raw_price = float(row.get("close", np.nan))
-            fill_ts = ts_idx
-
-        if not np.isfinite(raw_price):
-            continue
-
-        stop = float(row["stop_price"]) if pd.notna(row["stop_price"]) else np.nan
-        if not np.isfinite(stop):
-            continue
-
-        entry_price = apply_slippage(side_lit, fill_ts, raw_price, cfg)
-
-        risk_per_unit = abs(entry_price - stop)
-        if risk_per_unit <= 0 or not np.isfinite(risk_per_unit):
-            continue
-
-        or_high = float(row.get("or_high", np.nan))
-        or_low = float(row.get("or_low", np.nan))
-        or_height = (
-            (or_high - or_low)
-            if np.isfinite(or_high) and np.isfinite(or_low)
-            else np.nan
-        )
+    or_height_arr = _take("or_high", entry_pos) - _take("or_low", entry_pos)
+    or_height_arr[~np.isfinite(or_height_arr)] = np.nan
+    risk_cap_arr = np.where(
+        or_height_arr > 0, or_height_arr * float(max_risk_mult), np.inf
+    )
 
-        if np.isfinite(or_height) and or_height > 0:
-            risk_cap = float(or_height) * float(max_risk_mult)
-            if risk_per_unit > risk_cap:
-                continue
-
-        risk_R = 1.0
-        sl_ticks = risk_per_unit / tick_size if tick_size > 0 else np.nan
-
-        slip_ticks = 0.0
-        slip_exit_ticks = 0.0
-        if tick_size > 0:
-            slip_ticks = (entry_price - raw_price) / tick_size
-
-        micro_dir = int(row.get("micro_break_dir", 0) or 0)
-        engulf_dir = int(row.get("engulf_dir", 0) or 0)
-        trigger_type = "unknown"
-        if dir_val > 0:
-            if micro_dir > 0:
-                trigger_type = "swingbreak"
-            elif engulf_dir > 0:
-                trigger_type = "engulf"
-        else:
-            if micro_dir < 0:
-                trigger_type = "swingbreak"
-            elif engulf_dir < 0:
-                trigger_type = "engulf"
-
-        vwap = float(row.get("vwap", np.nan))
-        v1u = float(row.get("vwap_1u", np.nan))
-        v1d = float(row.get("vwap_1d", np.nan))
-        location = "none"
-        if np.isfinite(vwap):
-            price = float(row.get("close", np.nan))
-            if np.isfinite(price):
-                if dir_val > 0:
-                    if np.isfinite(v1u) and vwap <= price <= v1u:
-                        location = (
-                            "vwap"
-                            if abs(price - vwap) <= abs(price - v1u)
-                            else "+1sigma"
-                        )
-                else:
-                    if np.isfinite(v1d) and v1d <= price <= vwap:
-                        location = (
-                            "vwap"
-                            if abs(price - vwap) <= abs(price - v1d)
-                            else "-1sigma"
-                        )
-
-        exit_time = pd.NaT
-        realized_R = 0.0
-        tp1_price = entry_price + side_sign * risk_per_unit * 1.0
-        tp2_price = entry_price + side_sign * risk_per_unit * 2.0
-        t_to_tp1_min = np.nan
-        time_stop_reason = "none"
-
-        entry_time = fill_ts
-        trade_date = entry_time.date()
-
-        if use_management and mgmt_cfg and time_cfg:
-            if trade_date not in session_cache:
-                idx_all = mkt_idx
-                mask_session = idx_all.date == trade_date
-
-                session_df = mkt.loc[mask_session].copy()
+    risk_arr: np.ndarray = np.abs(entry_price_arr - stop_arr)
+    with np.errstate(invalid="ignore"):
+        valid &= np.isfinite(risk_arr) & (risk_arr > 0) & ~(risk_arr > risk_cap_arr)
+
+    keep = np.flatnonzero(valid)
+    if len(keep) == 0:
+        return _EMPTY_TRADES.copy()
+
+    side_sign_arr = side_sign_arr[keep]
+    dir_arr = dir_arr[keep]
+    raw_price_arr = raw_price_arr[keep]
+    entry_price_arr = entry_price_arr[keep]
+    stop_arr = stop_arr[keep]
+    risk_arr = risk_arr[keep]
+    or_height_arr = or_height_arr[keep]
+    sel = entry_pos[keep]
+    signal_ts_idx = mkt_idx[sel]
+    fill_ts_idx = fill_ts_idx[keep]
+    trade_dates = fill_ts_idx.date
+
+    sl_ticks_arr = risk_arr / tick_size if tick_size > 0 else np.full(len(keep), np.nan)
+    slip_ticks_arr = (
+        (entry_price_arr - raw_price_arr) / tick_size
+        if tick_size > 0
+        else np.zeros(len(keep))
+    )
 
-                for c in feature_cols_needed:
-                    if c not in session_df.columns and c in sig.columns:
-                        session_df[c] = sig.loc[mask_session, c]
+    micro_arr = _dir_col(df, "micro_break_dir", sel)
+    engulf_arr = _dir_col(df, "engulf_dir", sel)
+    is_long = dir_arr > 0
+    is_short = ~is_long
+    trigger_code = np.where(
+        micro_arr * side_sign_arr > 0,
+        np.int8(1),
+        np.where(engulf_arr * side_sign_arr > 0, np.int8(2), np.int8(0)),
+    )
+    trigger_type_arr = pd.Categorical.from_codes(
+        trigger_code, dtype=_TRADE_SCHEMA["trigger_type"]
+    )
+
+    price = _take("close", sel) if "close" in df.columns else np.full(len(keep), np.nan)
+    vwap_arr = _take("vwap", sel)
+    v1u_arr = _take("vwap_1u", sel)
+    v1d_arr = _take("vwap_1d", sel)
+    with np.errstate(invalid="ignore"):
+        base_ok = np.isfinite(vwap_arr) & np.isfinite(price)
+        long_in = (
+            is_long
+            & base_ok
+            & np.isfinite(v1u_arr)
+            & (vwap_arr <= price)
+            & (price <= v1u_arr)
+        )
+        short_in = (
+            is_short
+            & base_ok
+            & np.isfinite(v1d_arr)
+            & (v1d_arr <= price)
+            & (price <= vwap_arr)
+        )
+        dist_band = np.abs(price - np.where(is_long, v1u_arr, v1d_arr))
+        location_code = np.where(
+            long_in | short_in,
+            np.where(
+                np.abs(price - vwap_arr) <= dist_band,
+                np.int8(1),
+                np.where(is_long, np.int8(2), np.int8(3)),
+            ),
+            np.int8(0),
+        )
+    location_arr = pd.Categorical.from_codes(
+        location_code, dtype=_TRADE_SCHEMA["location"]
+    )
 
-                session_cache[trade_date] = session_df
+    n_trades = len(keep)
+    exit_times: list[Any] = [pd.NaT] * n_trades
+    realized_R_arr = np.zeros(n_trades)
+    tp1_arr = entry_price_arr + side_sign_arr * risk_arr * 1.0
+    tp2_arr = entry_price_arr + side_sign_arr * risk_arr * 2.0
+    t_to_tp1_arr = np.full(n_trades, np.nan)
+    time_stop_arr = np.full(n_trades, "none", dtype=object)
+    slip_exit_arr = np.zeros(n_trades)
+
+    # --- Per-trade lifecycle (path dependent, so stays a loop) ------------
+    if use_management and mgmt_cfg and time_cfg:
+        # Sessions are contiguous row ranges of the (sorted) market index, so
+        # each one is located by int day key + searchsorted, not by comparing
+        # Python `date` objects across the whole index.
+        mkt_days = _session_codes(mkt_idx)
+        fill_days = mkt_days[fill_pos[keep]]
+        fill_rows = fill_pos[keep]
+        session_cache: dict[int, tuple[int, pd.DataFrame, SessionArrays]] = {}
+        feature_cols_needed = (
+            "vwap",
+            "vwap_1u",
+            "vwap_1d",
+            "vwap_2u",
+            "vwap_2d",
+            "trend_5m",
+            "trend_dir_5m",
+            "trend5",
+            "trend_dir",
+            "trend5_dir",
+        )
+        pdh_arr = _take("pdh", sel)
+        pdl_arr = _take("pdl", sel)
 
-            session_df = session_cache[trade_date]
+        for k in range(n_trades):
+            day = int(fill_days[k])
+            if day not in session_cache:
+                lo = int(np.searchsorted(mkt_days, day, side="left"))
+                hi = int(np.searchsorted(mkt_days, day, side="right"))
 
-            entry_idx_arr = session_df.index.get_indexer(pd.DatetimeIndex([entry_time]))
-            entry_idx = int(entry_idx_arr[0]) if len(entry_idx_arr) else -1
-            if entry_idx < 0:
-                continue
+                session_df = mkt.iloc[lo:hi].copy()
 
-            pdh = float(row.get("pdh", np.nan))
-            pdl = float(row.get("pdl", np.nan))
+                for c in feature_cols_needed:
+                    if c not in session_df.columns and c in sig.columns:
+                        session_df[c] = sig[c].to_numpy()[lo:hi]
+
+                session_cache[day] = (
+                    lo,
+                    session_df,
+                    SessionArrays.from_bars(session_df),
+                )
+
+            session_lo, session_df, session_arrays = session_cache[day]
+            entry_idx = int(fill_rows[k]) - session_lo
+
+            side_sign = int(side_sign_arr[k])
+            entry_price = float(entry_price_arr[k])
+            stop = float(stop_arr[k])
+            or_height = float(or_height_arr[k])
+            pdh = float(pdh_arr[k])
+            pdl = float(pdl_arr[k])
             refs = {
                 "pdh": pdh if np.isfinite(pdh) else 0.0,
                 "pdl": pdl if np.isfinite(pdl) else 0.0,
-                "or_height": float(or_height) if np.isfinite(or_height) else 0.0,
+                "or_height": or_height if np.isfinite(or_height) else 0.0,
             }
 
             conds = build_time_stop_condition_series(
                 session_df=session_df,
                 entry_idx=entry_idx,
                 side_sign=side_sign,
-                entry_price=float(entry_price),
-                stop_price=float(stop),
+                entry_price=entry_price,
+                stop_price=stop,
             )
 
             lifecycle = manage_trade_lifecycle(
                 bars=session_df,
                 entry_idx=entry_idx,
                 side=side_sign,
-                entry_price=float(entry_price),
-                stop_price=float(stop),
+                entry_price=entry_price,
+                stop_price=stop,
                 mgmt_cfg=mgmt_cfg,
                 time_cfg=time_cfg,
                 refs=refs,
@@ -322,65 +452,52 @@ def simulate_trades(
                 sigma_ok=conds.sigma_ok,
                 dd_ok=conds.dd_ok,
                 slippage_cfg=cfg,
+                arrays=session_arrays,
             )
 
-            exit_time = lifecycle["exit_time"]
-            realized_R = float(lifecycle["realized_R"])
+            exit_times[k] = lifecycle["exit_time"]
+            realized_R_arr[k] = float(lifecycle["realized_R"])
             exit_price = float(lifecycle.get("exit_price", np.nan))
             exit_price_raw = float(lifecycle.get("exit_price_raw", np.nan))
-            tp1_price = float(lifecycle["tp1_price"])
-            tp2_price = (
-                float(lifecycle["tp2_price"])
-                if lifecycle["tp2_price"] is not None
-                else tp2_price
-            )
-            t_to_tp1_min = (
-                float(lifecycle["t_to_tp1_min"])
-                if lifecycle["t_to_tp1_min"] is not None
-                else np.nan
-            )
-            time_stop_reason = lifecycle["time_stop_reason"] or "none"
+            tp1_arr[k] = float(lifecycle["tp1_price"])
+            if lifecycle["tp2_price"] is not None:
+                tp2_arr[k] = float(lifecycle["tp2_price"])
+            if lifecycle["t_to_tp1_min"] is not None:
+                t_to_tp1_arr[k] = float(lifecycle["t_to_tp1_min"])
+            time_stop_arr[k] = lifecycle["time_stop_reason"] or "none"
             if (
                 tick_size > 0
                 and np.isfinite(exit_price)
                 and np.isfinite(exit_price_raw)
             ):
-                slip_exit_ticks = (exit_price - exit_price_raw) / tick_size
-
-        records.append(
-            {
-                "date": trade_date,
-                "signal_time": ts_idx,
-                "entry_time": entry_time,
-                "exit_time": exit_time,
-                "side": side_lit,
-                "entry": float(entry_price),
-                "stop": float(stop),
-                "tp1": float(tp1_price),
-                "tp2": float(tp2_price),
-                "or_height": float(or_height) if np.isfinite(or_height) else np.nan,
-                "sl_ticks": float(sl_ticks) if np.isfinite(sl_ticks) else np.nan,
-                "risk_R": float(risk_R),
-                "realized_R": float(realized_R),
-                "t_to_tp1_min": t_to_tp1_min,
-                "trigger_type": trigger_type,
-                "location": location,
-                "time_stop": time_stop_reason,
-                "disqualifier": "none",
-                "slippage_entry_ticks": float(slip_ticks),
-                "slippage_exit_ticks": float(slip_exit_ticks),
-            }
-        )
-
-    if not records:
-        return pd.DataFrame(columns=_TRADE_COLS)
-
-    trades = pd.DataFrame.from_records(records)
-    for col in _TRADE_COLS:
-        if col not in trades:
-            trades[col] = np.nan
-
-    return trades[_TRADE_COLS]
+                slip_exit_arr[k] = (exit_price - exit_price_raw) / tick_size
+
+    trades = pd.DataFrame(
+        {
+            "date": trade_dates,
+            "signal_time": signal_ts_idx,
+            "entry_time": fill_ts_idx,
+            "exit_time": pd.DatetimeIndex(exit_times),
+            "side": np.where(is_long, "long", "short").astype(object),
+            "entry": entry_price_arr,
+            "stop": stop_arr,
+            "tp1": tp1_arr,
+            "tp2": tp2_arr,
+            "or_height": or_height_arr,
+            "sl_ticks": np.where(np.isfinite(sl_ticks_arr), sl_ticks_arr, np.nan),
+            "risk_R": np.ones(n_trades),
+            "realized_R": realized_R_arr,
+            "t_to_tp1_min": t_to_tp1_arr,
+            "trigger_type": trigger_type_arr,
+            "location": location_arr,
+            "time_stop": time_stop_arr,
+            "disqualifier": np.full(n_trades, "none", dtype=object),
+            "slippage_entry_ticks": slip_ticks_arr,
+            "slippage_exit_ticks": slip_exit_arr,
+        },
+        columns=_TRADE_COLS,
+    )
+    return trades
 
 
 def generate_signals(
@@ -390,9 +507,14 @@ def generate_signals(
 ) -> pd.DataFrame:
     """
     Computes all signal columns (Unlock, Zone, Trigger) in a vectorized manner.
+
+    Signals are built as a struct of NumPy arrays keyed by column name and
+    joined onto the input frame in a single `assign` at the end.
     """
-    out = df_1m.copy()
+    params = _resolve_signal_params(cfg)
+    n = len(df_1m)
 
+    sig: dict[str, Any] = {}
     std_defaults: dict[str, object] = {
         "time_window_ok": True,
         "or_break_unlock": False,
@@ -403,35 +525,36 @@ def generate_signals(
         "stop_price": np.nan,
     }
     for col, val in std_defaults.items():
-        if col not in out:
-            out[col] = cast(Any, val)
+        sig[col] = df_1m[col] if col in df_1m.columns else val
 
-    idx = cast(pd.DatetimeIndex, out.index)
+    def _col(name: str) -> Any:
+        return sig[name] if name in sig else df_1m[name]
+
+    def _has(name: str) -> bool:
+        return name in sig or name in df_1m.columns
+
+    idx = cast(pd.DatetimeIndex, df_1m.index)
     if idx.tz is not None:
         idx_et = idx.tz_convert("America/New_York")
     else:
         idx_et = idx
-    dates = pd.Index(idx_et.date, name="date")
-    times = idx_et.time
+    session_ids = _session_codes(idx_et)
+    starts = session_starts(session_ids)
 
-    if (
-        "trend_5m" not in out.columns
-        and df_5m is not None
-        and "trend_5m" in df_5m.columns
-    ):
+    if not _has("trend_5m") and df_5m is not None and "trend_5m" in df_5m.columns:
         trend_5m = df_5m["trend_5m"].shift(1)
-        out["trend_5m"] = (
-            trend_5m.reindex(out.index, method="ffill").fillna(0).astype(float)
+        sig["trend_5m"] = (
+            trend_5m.reindex(df_1m.index, method="ffill").fillna(0).astype(float)
         )
     if (
-        "trend_dir_5m" not in out.columns
+        not _has("trend_dir_5m")
         and df_5m is not None
         and "trend_dir_5m" in df_5m.columns
     ):
         trend_dir_5m = df_5m["trend_dir_5m"].shift(1)
-        out["trend_dir_5m"] = trend_dir_5m.reindex(out.index, method="ffill")
+        sig["trend_dir_5m"] = trend_dir_5m.reindex(df_1m.index, method="ffill")
 
-    required = {
+    required = (
         "close",
         "or_high",
         "or_low",
@@ -441,78 +564,53 @@ def generate_signals(
         "vwap_2u",
         "vwap_2d",
         "trend_5m",
-    }
-    if not required.issubset(out.columns):
-        return out
-
-    close = out["close"].astype(float)
-    orh = out["or_high"].astype(float)
-    orl = out["or_low"].astype(float)
-    vwap = out["vwap"].astype(float)
-    v1u = out["vwap_1u"].astype(float)
-    v1d = out["vwap_1d"].astype(float)
-    v2u = out["vwap_2u"].astype(float)
-    v2d = out["vwap_2d"].astype(float)
-    trend = out["trend_5m"].astype(float)
-
-    ew = getattr(cfg, "entry_window", None) if cfg is not None else None
-    if ew is None:
-        time_ok = pd.Series(True, index=out.index)
+    )
+    if not all(_has(c) for c in required):
+        return df_1m.assign(**sig)
+
+    close = _f64(_col("close"))
+    orh = _f64(_col("or_high"))
+    orl = _f64(_col("or_low"))
+    vwap = _f64(_col("vwap"))
+    v1u = _f64(_col("vwap_1u"))
+    v1d = _f64(_col("vwap_1d"))
+    v2u = _f64(_col("vwap_2u"))
+    v2d = _f64(_col("vwap_2d"))
+    trend = _f64(_col("trend_5m"))
+
+    time_ok: np.ndarray
+    if params.entry_start_ns is None or params.entry_end_ns is None:
+        time_ok = np.ones(n, dtype=bool)
     else:
-        start_time = pd.Timestamp(getattr(ew, "start", "09:35")).time()
-        end_time = pd.Timestamp(getattr(ew, "end", "11:00")).time()
-        time_ok = pd.Series(
-            (times >= start_time) & (times <= end_time), index=out.index
-        )
-    out["time_window_ok"] = time_ok
+        tod = wall_day_tod(idx_et)[1]
+        time_ok = (tod >= params.entry_start_ns) & (tod <= params.entry_end_ns)
+    sig["time_window_ok"] = time_ok
 
     is_long_trend = trend > 0
     is_short_trend = trend < 0
 
-    dir_series = pd.Series(
-        np.where(is_long_trend, 1, np.where(is_short_trend, -1, 0)).astype("int8"),
-        index=out.index,
-    )
-    out["direction"] = dir_series
+    direction = np.where(
+        is_long_trend, np.int8(1), np.where(is_short_trend, np.int8(-1), np.int8(0))
+    ).astype(np.int8, copy=False)
+    sig["direction"] = direction
 
-    breaks_long = close > orh
-    breaks_short = close < orl
-    above_vwap = close >= vwap
-    below_vwap = close <= vwap
+    long_unlock_raw = is_long_trend & (close > orh) & (close >= vwap) & time_ok
+    short_unlock_raw = is_short_trend & (close < orl) & (close <= vwap) & time_ok
+    unlock_raw = long_unlock_raw | short_unlock_raw
 
-    long_unlock_raw = is_long_trend & breaks_long & above_vwap & time_ok
-    short_unlock_raw = is_short_trend & breaks_short & below_vwap & time_ok
-    unlock_raw = pd.Series(
-        (long_unlock_raw | short_unlock_raw).astype(bool), index=out.index
-    )
-
-    out["unlocked"] = unlock_raw.groupby(dates).cummax()
-    prev = unlock_raw.groupby(dates).shift(1, fill_value=False)
-    out["or_break_unlock"] = unlock_raw & ~prev
+    unlocked = session_cumsum(unlock_raw, starts) > 0
+    unlock_event = unlock_raw & ~_session_shift(unlock_raw, 1, starts)
+    sig["or_break_unlock"] = unlock_event
 
-    hit_opp_long = is_long_trend & (close <= v2d)
-    hit_opp_short = is_short_trend & (close >= v2u)
-    hit_opp = (hit_opp_long | hit_opp_short).astype(bool)
+    hit_opp = (is_long_trend & (close <= v2d)) | (is_short_trend & (close >= v2u))
+    hit_for_disq = (hit_opp & unlocked) if params.disqualify_after_unlock else hit_opp
 
-    rules = getattr(cfg, "signals", None) if cfg is not None else None
-    disq_after_unlock = bool(getattr(rules, "disqualify_after_unlock", False))
+    disq = session_cumsum(hit_for_disq, starts) > 0
+    sig["disqualified_2sigma"] = disq
 
-    unlocked = out.get("unlocked", pd.Series(False, index=out.index)).astype(bool)
-    hit_for_disq = (hit_opp & unlocked) if disq_after_unlock else hit_opp
-
-    disq = hit_for_disq.groupby(dates).cummax().astype(bool)
-    out["disqualified_2sigma"] = disq
-
-    direction = out["direction"].astype("int8")
-    unlock_event = out["or_break_unlock"].astype(bool)
-    unlocked = out.get("unlocked", unlock_event).astype(bool)
-    disq = out["disqualified_2sigma"].astype(bool)
-
-    zone_touch_mode = str(getattr(rules, "zone_touch_mode", "close")).lower()
-
-    if zone_touch_mode == "range" and {"high", "low"}.issubset(out.columns):
-        hi = out["high"].astype(float)
-        lo = out["low"].astype(float)
+    if params.zone_touch_mode == "range" and _has("high") and _has("low"):
+        hi = _f64(_col("high"))
+        lo = _f64(_col("low"))
         long_zone_touch = (lo <= v1u) & (hi >= vwap)
         short_zone_touch = (hi >= v1d) & (lo <= vwap)
     else:
@@ -523,86 +621,54 @@ def generate_signals(
         (direction < 0) & short_zone_touch
     )
 
-    zone_candidate = (unlocked & ~unlock_event & ~disq & zone_touch).astype(bool)
+    zone_candidate = unlocked & ~unlock_event & ~disq & zone_touch
 
-    zone_count = zone_candidate.groupby(dates).cumsum()
+    zone_count = session_cumsum(zone_candidate, starts)
     in_zone = (zone_count == 1) & zone_candidate
+    sig["in_zone"] = in_zone
 
-    out["in_zone"] = in_zone.astype(bool)
-
-    micro_raw = (
-        out["micro_break_dir"]
-        if "micro_break_dir" in out.columns
-        else pd.Series(0, index=out.index)
-    )
-    engulf_raw = (
-        out["engulf_dir"]
-        if "engulf_dir" in out.columns
-        else pd.Series(0, index=out.index)
-    )
-
-    micro_dir = pd.to_numeric(micro_raw, errors="coerce").fillna(0).astype("int8")
-    engulf_dir = pd.to_numeric(engulf_raw, errors="coerce").fillna(0).astype("int8")
-
-    in_zone = out["in_zone"].astype(bool)
-    zone_seen = in_zone.groupby(dates).cummax().astype(bool)
+    micro_dir = _dir_col(df_1m, "micro_break_dir")
+    engulf_dir = _dir_col(df_1m, "engulf_dir")
 
-    lookback = int(getattr(rules, "trigger_lookback_bars", 2))
-    lookback = max(0, min(lookback, 10))
+    zone_seen = session_cumsum(in_zone, starts) > 0
 
     zone_recent = in_zone.copy()
-    for k in range(1, lookback + 1):
-        zone_recent = zone_recent | in_zone.groupby(dates).shift(
-            k, fill_value=False
-        ).astype(bool)
-
-    direction = out["direction"].astype("int8")
-    pattern_ok = ((micro_dir != 0) & (micro_dir == direction)) | (
-        (engulf_dir != 0) & (engulf_dir == direction)
-    )
-
-    time_ok = out["time_window_ok"].astype(bool)
-    disq = out["disqualified_2sigma"].astype(bool)
-
-    out["trigger_ok"] = (
-        (direction != 0) & zone_seen & zone_recent & pattern_ok & time_ok & ~disq
-    )
-
-    tick_size = 1.0
-    inst = getattr(cfg, "instrument", None) if cfg is not None else None
-    tick_size = float(getattr(inst, "tick_size", tick_size) or tick_size)
-
-    if hasattr(cfg, "slippage"):
-        slip = getattr(cfg, "slippage")
-        tick_size = float(getattr(slip, "tick_size", tick_size) or tick_size)
-
-    max_mult = 1.25
-    risk_cfg = getattr(cfg, "risk", None) if cfg is not None else None
-    max_mult = float(getattr(risk_cfg, "max_stop_or_mult", max_mult) or max_mult)
-
-    if "or_height" not in out.columns:
-        out["or_height"] = out["or_high"].astype(float) - out["or_low"].astype(float)
-
-    if "stop_price" in out.columns:
-        stop_price = pd.to_numeric(out["stop_price"], errors="coerce").astype(float)
+    for k in range(1, params.trigger_lookback + 1):
+        zone_recent |= _session_shift(in_zone, k, starts)
+
+    # Fused trigger pass: one bool buffer, narrowed in place. The explicit
+    # `pattern != 0` checks are implied by `direction != 0` and are dropped.
+    trigger = direction != 0
+    trigger &= (micro_dir == direction) | (engulf_dir == direction)
+    trigger &= zone_seen
+    trigger &= zone_recent
+    trigger &= time_ok
+    trigger &= ~disq
+    sig["trigger_ok"] = trigger
+
+    sig["unlocked"] = unlocked
+    if not _has("or_height"):
+        sig["or_height"] = orh - orl
+
+    if "stop_price" in df_1m.columns:
+        stop_price = pd.to_numeric(df_1m["stop_price"], errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
     else:
-        stop_price = pd.Series(np.nan, index=out.index, dtype=float)
-
-    direction = out["direction"].astype("int8")
+        stop_price = np.full(n, np.nan, dtype=float)
 
-    if "last_swing_low_price" in out.columns and "last_swing_high_price" in out.columns:
-        last_swing_lo = out["last_swing_low_price"].astype(float)
-        last_swing_hi = out["last_swing_high_price"].astype(float)
+    if _has("last_swing_low_price") and _has("last_swing_high_price"):
+        last_swing_lo = _f64(_col("last_swing_low_price"))
+        last_swing_hi = _f64(_col("last_swing_high_price"))
 
-        cand_stop = pd.Series(np.nan, index=out.index, dtype=float)
-        longs = direction > 0
-        shorts = direction < 0
-
-        cand_stop.loc[longs] = last_swing_lo.loc[longs] - tick_size
-        cand_stop.loc[shorts] = last_swing_hi.loc[shorts] + tick_size
+        cand_stop = np.where(
+            direction > 0,
+            last_swing_lo - params.tick_size,
+            np.where(direction < 0, last_swing_hi + params.tick_size, np.nan),
+        )
 
-        stop_price = stop_price.where(stop_price.notna(), cand_stop)
+        stop_price = np.where(np.isnan(stop_price), cand_stop, stop_price)
 
-    out["stop_price"] = stop_price
+    sig["stop_price"] = stop_price
 
-    return out
+    return df_1m.assign(**sig)
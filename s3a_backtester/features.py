@@ -6,47 +6,160 @@ Computes core quantitative features for the strategy, including:
 - VWAP Bands and standard deviations
 - Volatility measures (ATR15)
 - Swing detection (Strictly Delayed/Confirmed)
+
+Frame-returning helpers take a shallow copy of their input: the original
+columns share buffers with the caller's frame and only added columns are
+newly allocated. Treat the returned OHLCV columns as read-only.
 """
 
 from __future__ import annotations
 
-from datetime import time
 from typing import Any, cast
 
 import numpy as np
 import pandas as pd
 
+from .sessions import session_cumsum, session_starts, wall_day_tod
+
+
+def _day_groups(day_codes: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Maps per-bar day codes to dense group ids 0..n_days-1.
+    O(N) boundary scan for time-ordered input, sort-based fallback otherwise.
+    """
+    if len(day_codes) == 0:
+        return np.empty(0, dtype=np.intp), 0
+    if np.all(day_codes[1:] >= day_codes[:-1]):
+        new_day = np.zeros(len(day_codes), dtype=np.intp)
+        new_day[session_starts(day_codes)] = 1
+        group_id = np.cumsum(new_day) - 1
+        return group_id, int(group_id[-1]) + 1
+    uniq, inverse = np.unique(day_codes, return_inverse=True)
+    return inverse, len(uniq)
+
+
+def _last_flagged_value(
+    values: np.ndarray, flags: np.ndarray, groups: np.ndarray
+) -> np.ndarray:
+    """
+    Value at the most recent flagged row of the same group (NaN before the first).
+    One index scan with `np.maximum.accumulate` instead of per-group `ffill`.
+    """
+    n = len(values)
+    order: np.ndarray | None = None
+    if n > 1 and not np.all(groups[1:] >= groups[:-1]):
+        order = np.argsort(groups, kind="stable")
+        values, flags, groups = values[order], flags[order], groups[order]
+
+    pos = np.where(flags, np.arange(n), -1)
+    np.maximum.accumulate(pos, out=pos)
+    hit = pos >= 0
+    hit[hit] = groups[pos[hit]] == groups[hit]
+
+    last = np.full(n, np.nan, dtype=np.float64)
+    last[hit] = values[pos[hit]]
+    if order is not None:
+        unsorted = np.empty_like(last)
+        unsorted[order] = last
+        last = unsorted
+    return last
+
+
+def _confirmed_pivots(
+    x: np.ndarray, eligible: np.ndarray, lb: int, rb: int, *, is_high: bool
+) -> np.ndarray:
+    """
+    Flags bar i when x[i - rb] beats its `lb` left neighbours strictly and its
+    `rb` right neighbours non-strictly (lows: mirrored). One vector comparison
+    per window offset instead of a Python loop over bars.
+    """
+    n = len(x)
+    conf = np.zeros(n, dtype=bool)
+    w = lb + rb
+    if n <= w:
+        return conf
+
+    v = x if is_high else -x
+    pivot = v[lb : n - rb]
+    ok = eligible[w:].copy()
+    for k in range(1, lb + 1):
+        ok &= pivot > v[lb - k : n - rb - k]
+    for k in range(1, rb + 1):
+        ok &= pivot >= v[lb + k : n - rb + k]
+    conf[w:] = ok
+    return conf
+
+
+def _segment_nancumsum(x: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-segment cumsum with pandas `skipna` semantics (NaN in -> NaN out)."""
+    nan = np.isnan(x)
+    out = session_cumsum(np.where(nan, 0.0, x), starts)
+    out[nan] = np.nan
+    return out
+
+
+def _segment_expanding_std(x: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Per-segment expanding sample std (ddof=1, NaNs skipped, < 2 obs -> 0.0).
+    Moments are accumulated around each segment's minimum to avoid cancellation.
+    """
+    lengths = np.diff(np.append(starts, len(x)))
+    with np.errstate(invalid="ignore"):
+        ref = np.repeat(np.fmin.reduceat(x, starts), lengths)
+    d = x - ref
+    valid = ~np.isnan(d)
+    d[~valid] = 0.0
+
+    cnt = session_cumsum(valid.astype(np.float64), starts)
+    s1 = session_cumsum(d, starts)
+    s2 = session_cumsum(d * d, starts)
+
+    sd = np.zeros(len(x), dtype=np.float64)
+    many = cnt >= 2
+    var = (s2[many] - s1[many] * s1[many] / cnt[many]) / (cnt[many] - 1.0)
+    sd[many] = np.sqrt(np.maximum(var, 0.0))
+    return sd
+
 
 def compute_session_refs(df1: pd.DataFrame) -> pd.DataFrame:
     """Calculates session-specific reference levels like OR High/Low."""
-    out = df1.copy()
+    out = df1.copy(deep=False)
 
     for col in ["or_high", "or_low", "or_height", "pdh", "pdl", "onh", "onl"]:
         if col not in out.columns:
             out[col] = np.nan
 
+    if out.empty:
+        return out
+
     idx = cast(pd.DatetimeIndex, out.index)
-    grouped = out.groupby(idx.date, sort=False)
+    day, tod = wall_day_tod(idx)
+    day_id, n_days = _day_groups(day)
+
+    or_start_ns = 9 * 3600 * 1_000_000_000 + 30 * 60 * 1_000_000_000
+    or_end_ns = or_start_ns + 5 * 60 * 1_000_000_000
 
-    or_start = time(9, 30)
-    or_end = time(9, 35)
+    in_or = (tod >= or_start_ns) & (tod < or_end_ns)
+    or_day = day_id[in_or]
 
-    for _, day in grouped:
-        or_slice = day.between_time(or_start, or_end, inclusive="left")
-        if or_slice.empty:
-            continue
+    day_high = np.full(n_days, np.nan)
+    day_low = np.full(n_days, np.nan)
+    np.fmax.at(day_high, or_day, out["high"].to_numpy(dtype=float)[in_or])
+    np.fmin.at(day_low, or_day, out["low"].to_numpy(dtype=float)[in_or])
 
-        or_high = or_slice["high"].max()
-        or_low = or_slice["low"].min()
-        or_height = or_high - or_low
+    has_or = np.zeros(n_days, dtype=bool)
+    has_or[or_day] = True
 
-        day_idx = cast(pd.DatetimeIndex, day.index)
-        valid_indices = day_idx[day_idx.time >= or_end]
+    valid = (tod >= or_end_ns) & has_or[day_id]
+    or_high = day_high[day_id]
+    or_low = day_low[day_id]
 
-        if not valid_indices.empty:
-            out.loc[valid_indices, "or_high"] = or_high
-            out.loc[valid_indices, "or_low"] = or_low
-            out.loc[valid_indices, "or_height"] = or_height
+    for col, vals in (
+        ("or_high", or_high),
+        ("or_low", or_low),
+        ("or_height", or_high - or_low),
+    ):
+        out[col] = np.where(valid, vals, out[col].to_numpy(dtype=float))
 
     return out
 
@@ -57,44 +170,48 @@ def compute_session_vwap_bands(
     """Computes intraday VWAP and standard deviation bands."""
     if "close" not in df1.columns:
         raise ValueError(f"compute_session_vwap_bands: columns={list(df1.columns)}")
-    out = df1.copy()
+    out = df1.copy(deep=False)
 
-    price = (
+    price_s = (
         out["close"] if use_close else (out["high"] + out["low"] + out["close"]) / 3.0
     )
-    vol = out.get("volume", pd.Series(1.0, index=out.index)).astype(float)
-
-    vwap = pd.Series(index=out.index, dtype="float64")
-    sd = pd.Series(index=out.index, dtype="float64")
-
-    idx = cast(pd.DatetimeIndex, out.index)
-    grouped = out.groupby(idx.date, sort=False)
-    or_start = time(9, 30)
-
-    for _, day in grouped:
-        day_idx = cast(pd.DatetimeIndex, day.index)
-        day = day[day_idx.time >= or_start]
-        if day.empty:
-            continue
-
-        p = price.loc[day.index]
-        v = vol.loc[day.index]
-
-        pv = (p * v).cumsum()
-        cv = v.cumsum()
-
-        vwap_day = pv / cv
-        sd_day = p.expanding().std().fillna(0.0)
-
-        vwap.loc[day.index] = vwap_day
-        sd.loc[day.index] = sd_day
+    price = price_s.to_numpy(dtype=np.float64)
+    if "volume" in out.columns:
+        vol = out["volume"].to_numpy(dtype=np.float64)
+    else:
+        vol = np.ones(len(out), dtype=np.float64)
+
+    vwap = np.full(len(out), np.nan, dtype=np.float64)
+    sd = np.full(len(out), np.nan, dtype=np.float64)
+
+    # Each session accumulates from 09:30 (wall clock) onwards; earlier bars
+    # stay NaN. Rows are visited session-by-session in their original order.
+    all_days, tod = wall_day_tod(cast(pd.DatetimeIndex, out.index))
+    or_start_ns = (9 * 3600 + 30 * 60) * 1_000_000_000
+    rows = np.flatnonzero(tod >= or_start_ns)
+
+    if len(rows):
+        day = all_days[rows]
+        if not np.all(day[1:] >= day[:-1]):
+            sort = np.argsort(day, kind="stable")
+            rows, day = rows[sort], day[sort]
+        starts = session_starts(day)
+
+        p = price[rows]
+        v = vol[rows]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap[rows] = _segment_nancumsum(p * v, starts) / _segment_nancumsum(
+                v, starts
+            )
+        sd[rows] = _segment_expanding_std(p, starts)
 
     out["vwap"] = vwap
     out["vwap_sd"] = sd
-    out["band_p1"] = vwap + sd
-    out["band_m1"] = vwap - sd
-    out["band_p2"] = vwap + 2 * sd
-    out["band_m2"] = vwap - 2 * sd
+    # All four bands come from one (N, 4) broadcast.
+    band_mults = np.array([1.0, -1.0, 2.0, -2.0])
+    out[["band_p1", "band_m1", "band_p2", "band_m2"]] = (
+        vwap[:, None] + sd[:, None] * band_mults
+    )
 
     return out
 
@@ -106,23 +223,20 @@ def compute_atr15(df1: pd.DataFrame, window: int = 15) -> pd.Series:
     if missing:
         raise KeyError(f"Missing columns for ATR calc: {missing}")
 
-    high = df1["high"].astype("float64")
-    low = df1["low"].astype("float64")
-    close = df1["close"].astype("float64")
+    high = df1["high"].to_numpy(dtype=np.float64)
+    low = df1["low"].to_numpy(dtype=np.float64)
+    close = df1["close"].to_numpy(dtype=np.float64)
 
-    prev_close = close.shift(1)
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
 
-    tr_components = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
+    # fmax skips NaN like DataFrame.max(axis=1), so bar 0 falls back to H - L.
+    tr = np.fmax(
+        np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close)
     )
-    tr = tr_components.max(axis=1)
 
-    atr = tr.rolling(window=window, min_periods=1).mean()
+    atr = pd.Series(tr, index=df1.index).rolling(window=window, min_periods=1).mean()
     atr.name = "atr15"
     return atr
 
@@ -149,18 +263,14 @@ def find_swings_1m(
     if lb < 1 or rb < 1:
         raise ValueError("lb and rb must be >= 1")
 
-    df = df1.copy()
-
-    df["swing_high_confirmed"] = False
-    df["swing_low_confirmed"] = False
-    df["last_swing_high_price"] = np.nan
-    df["last_swing_low_price"] = np.nan
+    df = df1.copy(deep=False)
+    n_total = len(df)
 
     idx = df.index
     day_keys: Any
 
     if isinstance(idx, pd.DatetimeIndex):
-        day_keys = idx.normalize()
+        day_keys = wall_day_tod(idx)[0]
     else:
         dt = pd.to_datetime(idx, errors="coerce")
         if dt.isna().to_numpy().any():
@@ -168,49 +278,49 @@ def find_swings_1m(
         else:
             day_keys = dt.normalize()
 
-    for _, day_df in df.groupby(day_keys):
-        n = len(day_df)
-        if n < lb + rb + 1:
-            continue
-
-        highs = day_df[high_col].to_numpy()
-        lows = day_df[low_col].to_numpy()
-
-        day_indices = day_df.index
-
-        s_high_conf = np.zeros(n, dtype=bool)
-        s_low_conf = np.zeros(n, dtype=bool)
-
-        s_last_high = np.full(n, np.nan, dtype=np.float64)
-        s_last_low = np.full(n, np.nan, dtype=np.float64)
-
-        for i in range(lb + rb, n):
-            pivot_idx = i - rb
-
-            pivot_h = highs[pivot_idx]
-
-            left_side_h = highs[pivot_idx - lb : pivot_idx]
-            right_side_h = highs[pivot_idx + 1 : pivot_idx + rb + 1]
-
-            if np.all(pivot_h > left_side_h) and np.all(pivot_h >= right_side_h):
-                s_high_conf[i] = True
-                s_last_high[i] = pivot_h
-
-            pivot_l = lows[pivot_idx]
-            left_side_l = lows[pivot_idx - lb : pivot_idx]
-            right_side_l = lows[pivot_idx + 1 : pivot_idx + rb + 1]
-
-            if np.all(pivot_l < left_side_l) and np.all(pivot_l <= right_side_l):
-                s_low_conf[i] = True
-                s_last_low[i] = pivot_l
-
-        df.loc[day_indices, "swing_high_confirmed"] = s_high_conf
-        df.loc[day_indices, "swing_low_confirmed"] = s_low_conf
-
-        temp_high = pd.Series(s_last_high, index=day_indices)
-        temp_low = pd.Series(s_last_low, index=day_indices)
-
-        df.loc[day_indices, "last_swing_high_price"] = temp_high.ffill()
-        df.loc[day_indices, "last_swing_low_price"] = temp_low.ffill()
+    # Work in day-contiguous order (a no-op for time-sorted input); rows with
+    # an unparseable day key (code -1) never confirm a swing.
+    day_id = np.asarray(pd.factorize(day_keys)[0], dtype=np.intp)
+    if isinstance(idx, pd.DatetimeIndex):
+        day_id[idx.isna()] = -1
+    order: np.ndarray | None = None
+    if n_total > 1 and not np.all(day_id[1:] >= day_id[:-1]):
+        order = np.argsort(day_id, kind="stable")
+        day_id = day_id[order]
+
+    all_highs = df[high_col].to_numpy(dtype=np.float64)
+    all_lows = df[low_col].to_numpy(dtype=np.float64)
+    if order is not None:
+        all_highs = all_highs[order]
+        all_lows = all_lows[order]
+
+    pos_in_day = np.arange(n_total)
+    starts = session_starts(day_id)
+    pos_in_day -= np.repeat(starts, np.diff(np.append(starts, n_total)))
+    eligible = (pos_in_day >= lb + rb) & (day_id >= 0)
+
+    high_conf = _confirmed_pivots(all_highs, eligible, lb, rb, is_high=True)
+    low_conf = _confirmed_pivots(all_lows, eligible, lb, rb, is_high=False)
+
+    # A confirmation at bar i reports the pivot price from bar i - rb (same day).
+    pivot_high = np.full(n_total, np.nan, dtype=np.float64)
+    pivot_low = np.full(n_total, np.nan, dtype=np.float64)
+    if n_total > rb:
+        pivot_high[rb:] = all_highs[:-rb]
+        pivot_low[rb:] = all_lows[:-rb]
+
+    last_high = _last_flagged_value(pivot_high, high_conf, day_id)
+    last_low = _last_flagged_value(pivot_low, low_conf, day_id)
+
+    if order is not None:
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(n_total)
+        high_conf, low_conf = high_conf[inverse], low_conf[inverse]
+        last_high, last_low = last_high[inverse], last_low[inverse]
+
+    df["swing_high_confirmed"] = high_conf
+    df["swing_low_confirmed"] = low_conf
+    df["last_swing_high_price"] = last_high
+    df["last_swing_low_price"] = last_low
 
     return df
@@ -9,11 +9,13 @@ Determines if a trading day should be skipped entirely based on:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
 import pandas as pd
 
+from .sessions import session_starts, wall_day_tod
+
 
 def build_session_filter_mask(
     df: pd.DataFrame,
@@ -39,74 +41,72 @@ def build_session_filter_mask(
     enable_news = bool(getattr(filters_cfg, "news_blackout", True))
     enable_dom = bool(getattr(filters_cfg, "enable_dom_filter", True))
 
-    session_idx = pd.Index([ts.date() for ts in df.index], name="session")
-    grp = df.groupby(session_idx)
+    # Sessions keyed by int64 wall-clock day number (no per-bar date objects).
+    session_key = wall_day_tod(cast(pd.DatetimeIndex, df.index))[0]
+
+    # Daily aggregates are segment reductions over day-contiguous rows
+    # (a stable sort is only needed for unsorted input).
+    order: np.ndarray | None = None
+    if not np.all(session_key[1:] >= session_key[:-1]):
+        order = np.argsort(session_key, kind="stable")
+    sorted_key = session_key if order is None else session_key[order]
+    starts = session_starts(sorted_key)
+    days = pd.Index(sorted_key[starts], name="session")
+
+    def _day_col(col: str) -> np.ndarray:
+        vals: np.ndarray = df[col].to_numpy(dtype=float, na_value=np.nan)
+        return vals if order is None else vals[order]
 
     if "or_high" in df.columns and "or_low" in df.columns:
-        daily_or_high = grp["or_high"].max()
-        daily_or_low = grp["or_low"].min()
-        daily_or_height = daily_or_high - daily_or_low
+        daily_or_height = pd.Series(
+            np.fmax.reduceat(_day_col("or_high"), starts)
+            - np.fmin.reduceat(_day_col("or_low"), starts),
+            index=days,
+        )
     else:
-        daily_or_height = pd.Series(np.nan, index=grp.groups.keys(), name="or_height")
+        daily_or_height = pd.Series(np.nan, index=days, name="or_height")
 
     if "atr15" in df.columns:
-        daily_atr15 = grp["atr15"].last()
-    else:
-        daily_atr15 = pd.Series(np.nan, index=grp.groups.keys(), name="atr15")
-
-    stats = pd.DataFrame(
-        {
-            "or_height": daily_or_height,
-            "atr15": daily_atr15,
-        }
-    ).sort_index()
-
-    stats["or_med_15"] = (
-        stats["or_height"].rolling(window=15, min_periods=5).median().shift(1)
-    )
-
-    p = max(0.0, min(100.0, low_atr_percentile)) / 100.0
-    if p == 0.0 or stats["atr15"].isna().all():
-        stats["atr_pXX_60"] = np.nan
-    else:
-        stats["atr_pXX_60"] = (
-            stats["atr15"].rolling(window=60, min_periods=20).quantile(p).shift(1)
+        # Last non-NaN value of each day (GroupBy.last semantics).
+        atr = _day_col("atr15")
+        pos = np.where(np.isnan(atr), -1, np.arange(len(atr)))
+        np.maximum.accumulate(pos, out=pos)
+        ends = np.append(starts[1:], len(atr)) - 1
+        last_pos = pos[ends]
+        has_val = last_pos >= starts
+        daily_atr15 = pd.Series(
+            np.where(has_val, atr[np.maximum(last_pos, 0)], np.nan), index=days
         )
-
-    if "news_blackout" in df.columns:
-        daily_news = grp["news_blackout"].max().astype(bool)
     else:
-        daily_news = pd.Series(False, index=stats.index, name="news_blackout")
+        daily_atr15 = pd.Series(np.nan, index=days, name="atr15")
 
-    if "dom_bad" in df.columns:
-        daily_dom = grp["dom_bad"].max().astype(bool)
-    else:
-        daily_dom = pd.Series(False, index=stats.index, name="dom_bad")
+    # Skip flags are OR-ed into one per-day bool buffer; disabled filters
+    # are never computed.
+    skip = np.zeros(len(days), dtype=bool)
 
-    tiny_or_day = pd.Series(False, index=stats.index)
     if enable_tiny_or:
-        tiny_or_day = (
-            stats["or_height"].notna()
-            & stats["or_med_15"].notna()
-            & (stats["or_height"] < stats["or_med_15"] * tiny_or_mult)
-        )
-
-    low_atr_day = pd.Series(False, index=stats.index)
-    if enable_low_atr:
-        prev_day_atr = stats["atr15"].shift(1)
-        low_atr_day = (
-            prev_day_atr.notna()
-            & stats["atr_pXX_60"].notna()
-            & (prev_day_atr < stats["atr_pXX_60"])
-        )
+        or_med_15 = daily_or_height.rolling(window=15, min_periods=5).median().shift(1)
+        with np.errstate(invalid="ignore"):
+            skip |= daily_or_height.to_numpy(dtype=float) < (
+                or_med_15.to_numpy(dtype=float) * tiny_or_mult
+            )
 
-    news_day = daily_news if enable_news else pd.Series(False, index=stats.index)
-    dom_day = daily_dom if enable_dom else pd.Series(False, index=stats.index)
-
-    skip_session = tiny_or_day | low_atr_day | news_day | dom_day
-
-    allowed = (~skip_session).reindex(session_idx).astype(bool)
-    allowed.index = df.index
-    allowed.name = "session_filter_ok"
-
-    return allowed
+    p = max(0.0, min(100.0, low_atr_percentile)) / 100.0
+    if enable_low_atr and p > 0.0 and not daily_atr15.isna().all():
+        atr_pxx_60 = daily_atr15.rolling(window=60, min_periods=20).quantile(p).shift(1)
+        prev_day_atr = daily_atr15.shift(1)
+        with np.errstate(invalid="ignore"):
+            skip |= prev_day_atr.to_numpy(dtype=float) < atr_pxx_60.to_numpy(
+                dtype=float
+            )
+
+    # Any flagged bar flags the day; an all-NaN day counts as flagged, as
+    # GroupBy.max().astype(bool) did.
+    if enable_news and "news_blackout" in df.columns:
+        skip |= np.fmax.reduceat(_day_col("news_blackout"), starts).astype(bool)
+
+    if enable_dom and "dom_bad" in df.columns:
+        skip |= np.fmax.reduceat(_day_col("dom_bad"), starts).astype(bool)
+
+    day_pos = np.searchsorted(days.to_numpy(), session_key)
+    return pd.Series(~skip[day_pos], index=df.index, name="session_filter_ok")
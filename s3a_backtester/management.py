@@ -18,8 +18,10 @@ import pandas as pd
 from .config import MgmtCfg, TimeStopCfg
 from .slippage import apply_slippage
 
+_NS_PER_MIN = 60_000_000_000
 
-@dataclass
+
+@dataclass(slots=True)
 class TP1Result:
     hit: bool
     idx: Optional[int]
@@ -29,7 +31,7 @@ class TP1Result:
     stop_after_tp1: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TP2Result:
     hit: bool
     idx: Optional[int]
@@ -38,7 +40,7 @@ class TP2Result:
     label: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeStopResult:
     idx: Optional[int]
     time: Optional[pd.Timestamp]
@@ -46,8 +48,8 @@ class TimeStopResult:
 
 
 def _first_touch_idx(
-    high: pd.Series,
-    low: pd.Series,
+    high: np.ndarray,
+    low: np.ndarray,
     target: float,
     side: int,
     start_idx: int,
@@ -60,19 +62,48 @@ def _first_touch_idx(
         return None
 
     if side == 1:
-        mask = high.iloc[start_idx + 1 :] >= target
+        mask = high[start_idx + 1 :] >= target
     else:
-        mask = low.iloc[start_idx + 1 :] <= target
+        mask = low[start_idx + 1 :] <= target
 
-    if not mask.any():
+    # argmax stops at the first True and allocates no index array.
+    rel = int(mask.argmax())
+    if not mask[rel]:
         return None
 
-    rel_positions = np.flatnonzero(mask.to_numpy())
-    if len(rel_positions) == 0:
-        return None
+    return start_idx + 1 + rel
+
+
+@dataclass(frozen=True)
+class SessionArrays:
+    """
+    Price and timestamp arrays of one session, shared by all its trades.
+    `ts_ns` is always in nanoseconds, whatever the resolution of the index.
+    """
+
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    ts_ns: np.ndarray
+
+    @classmethod
+    def from_bars(cls, bars: pd.DataFrame) -> SessionArrays:
+        return cls(
+            high=bars["high"].to_numpy(dtype=np.float64),
+            low=bars["low"].to_numpy(dtype=np.float64),
+            close=bars["close"].to_numpy(dtype=np.float64),
+            ts_ns=cast(Any, bars.index).as_unit("ns").asi8,
+        )
+
 
-    hit_pos = start_idx + 1 + int(rel_positions[0])
-    return hit_pos
+def _truthy(vals: np.ndarray) -> np.ndarray:
+    """Element-wise ``bool(v) and not isna(v)`` for a condition array."""
+    if vals.dtype == bool:
+        return vals
+    valid = pd.notna(vals)
+    out = np.zeros(len(vals), dtype=bool)
+    out[valid] = vals[valid].astype(bool)
+    return out
 
 
 def apply_tp1(
@@ -82,13 +113,17 @@ def apply_tp1(
     entry_price: float,
     stop_price: float,
     mgmt_cfg: MgmtCfg,
+    arrays: Optional[SessionArrays] = None,
 ) -> TP1Result:
     """Calculates if and when the first Take Profit level was hit."""
     if side not in (1, -1):
         raise ValueError(f"side must be +1 or -1, got {side!r}")
 
-    high = bars["high"]
-    low = bars["low"]
+    if arrays is not None:
+        high, low = arrays.high, arrays.low
+    else:
+        high = bars["high"].to_numpy(dtype=np.float64)
+        low = bars["low"].to_numpy(dtype=np.float64)
 
     risk_per_unit = float(abs(entry_price - stop_price))
     if not np.isfinite(risk_per_unit) or risk_per_unit <= 0.0:
@@ -134,58 +169,50 @@ def compute_tp2_target(
     stop_price: float,
     mgmt_cfg: MgmtCfg,
     refs: Mapping[str, float],
+    arrays: Optional[SessionArrays] = None,
 ) -> TP2Result:
     """Determines the TP2 target based on structure priority."""
-    high = bars["high"]
-    low = bars["low"]
+    if arrays is not None:
+        high, low = arrays.high, arrays.low
+    else:
+        high = bars["high"].to_numpy(dtype=np.float64)
+        low = bars["low"].to_numpy(dtype=np.float64)
 
     risk_per_unit = float(abs(entry_price - stop_price))
     if not np.isfinite(risk_per_unit) or risk_per_unit <= 0.0:
         risk_per_unit = 0.0
 
-    candidates: list[tuple[str, float, Optional[int]]] = []
+    # Targets are tried in priority order (pdh/pdl, measured move, R
+    # multiple), so a later target only wins if it is hit strictly earlier.
+    best_idx: Optional[int] = None
+    best_label = ""
+    best_price = 0.0
+
+    def _consider(label: str, target: float) -> None:
+        nonlocal best_idx, best_label, best_price
+        hit = _first_touch_idx(
+            high=high, low=low, target=target, side=side, start_idx=entry_idx
+        )
+        if hit is not None and (best_idx is None or hit < best_idx):
+            best_idx, best_label, best_price = hit, label, target
 
     pdh = refs.get("pdh")
     pdl = refs.get("pdl")
     if side == 1 and pdh is not None and np.isfinite(pdh) and pdh > entry_price:
-        idx_pdh = _first_touch_idx(
-            high=high, low=low, target=pdh, side=side, start_idx=entry_idx
-        )
-        candidates.append(("pdh_pdl", pdh, idx_pdh))
+        _consider("pdh_pdl", pdh)
     if side == -1 and pdl is not None and np.isfinite(pdl) and pdl < entry_price:
-        idx_pdl = _first_touch_idx(
-            high=high, low=low, target=pdl, side=side, start_idx=entry_idx
-        )
-        candidates.append(("pdh_pdl", pdl, idx_pdl))
+        _consider("pdh_pdl", pdl)
 
     or_height = refs.get("or_height")
     if or_height is not None and np.isfinite(or_height) and or_height > 0:
-        mm_target = entry_price + side * float(or_height)
-        idx_mm = _first_touch_idx(
-            high=high, low=low, target=mm_target, side=side, start_idx=entry_idx
-        )
-        candidates.append(("measured_move", mm_target, idx_mm))
+        _consider("measured_move", entry_price + side * float(or_height))
 
     if risk_per_unit > 0:
-        r_target = entry_price + side * mgmt_cfg.tp2_R * risk_per_unit
-        idx_r = _first_touch_idx(
-            high=high, low=low, target=r_target, side=side, start_idx=entry_idx
-        )
-        candidates.append(("r_multiple", r_target, idx_r))
+        _consider("r_multiple", entry_price + side * mgmt_cfg.tp2_R * risk_per_unit)
 
-    valid_hits = [
-        (label, price, idx) for (label, price, idx) in candidates if idx is not None
-    ]
-    if not valid_hits:
+    if best_idx is None:
         return TP2Result(hit=False, idx=None, time=None, price=None, label=None)
 
-    priority = {"pdh_pdl": 0, "measured_move": 1, "r_multiple": 2}
-
-    def sort_key(item: tuple[str, float, int]) -> tuple[int, int]:
-        label, _price, idx = item
-        return (idx, priority[label])
-
-    best_label, best_price, best_idx = sorted(valid_hits, key=sort_key)[0]
     best_time = bars.index[int(best_idx)]
 
     return TP2Result(
@@ -209,81 +236,73 @@ def run_time_stop(
     trend_ok: Optional[pd.Series] = None,
     sigma_ok: Optional[pd.Series] = None,
     dd_ok: Optional[pd.Series] = None,
+    arrays: Optional[SessionArrays] = None,
 ) -> TimeStopResult:
     """Evaluates time-based exit conditions, including optional extensions."""
-    if getattr(time_cfg, "mode", "15m") == "none":
+    if time_cfg.mode == "none":
         return TimeStopResult(idx=None, time=None, reason=None)
 
     idx = cast(Any, bars.index)
+    ts_ns: np.ndarray = arrays.ts_ns if arrays is not None else idx.as_unit("ns").asi8
 
-    entry_time = idx[entry_idx]
-    tp1_timeout_min = getattr(time_cfg, "tp1_timeout_min", 15)
-    max_holding_min = getattr(time_cfg, "max_holding_min", 45)
-    allow_extension = getattr(time_cfg, "allow_extension", True)
+    entry_ns = int(ts_ns[entry_idx])
+    tp1_timeout_min = time_cfg.tp1_timeout_min
+    max_holding_min = time_cfg.max_holding_min
+    allow_extension = time_cfg.allow_extension
 
-    tp1_deadline = entry_time + pd.Timedelta(minutes=tp1_timeout_min)
-    hard_deadline = entry_time + pd.Timedelta(minutes=max_holding_min)
+    tp1_deadline_ns = entry_ns + int(tp1_timeout_min * _NS_PER_MIN)
+    hard_deadline_ns = entry_ns + int(max_holding_min * _NS_PER_MIN)
 
-    if tp1_idx is not None:
-        tp1_time = idx[tp1_idx]
-        if tp1_time > tp1_deadline:
-            tp1_idx = None
+    if tp1_idx is not None and ts_ns[tp1_idx] > tp1_deadline_ns:
+        tp1_idx = None
 
-    def _first_bar_at_or_after(ts: pd.Timestamp) -> Optional[int]:
-        pos = idx.searchsorted(ts, side="left")
-        if pos >= len(idx):
+    def _first_bar_at_or_after(deadline_ns: int) -> Optional[int]:
+        pos = int(np.searchsorted(ts_ns, deadline_ns, side="left"))
+        if pos >= len(ts_ns):
             return None
-        return int(pos)
+        return pos
 
     if tp1_idx is None:
-        stop_idx = _first_bar_at_or_after(tp1_deadline)
+        stop_idx = _first_bar_at_or_after(tp1_deadline_ns)
         if stop_idx is None:
             return TimeStopResult(idx=None, time=None, reason=None)
 
-        final_int_idx = int(stop_idx)
-        return TimeStopResult(
-            idx=final_int_idx, time=idx[final_int_idx], reason="no_tp1_15m"
-        )
+        return TimeStopResult(idx=stop_idx, time=idx[stop_idx], reason="no_tp1_15m")
 
     if not allow_extension:
-        stop_idx = _first_bar_at_or_after(hard_deadline)
+        stop_idx = _first_bar_at_or_after(hard_deadline_ns)
         if stop_idx is None:
             return TimeStopResult(idx=None, time=None, reason=None)
 
-        final_int_idx = int(stop_idx)
-        return TimeStopResult(
-            idx=final_int_idx, time=idx[final_int_idx], reason="max_hold"
-        )
+        return TimeStopResult(idx=stop_idx, time=idx[stop_idx], reason="max_hold")
 
     start = tp1_idx + 1
     if start >= len(idx):
         return TimeStopResult(idx=None, time=None, reason=None)
 
-    def _cond(series: Optional[pd.Series], i: int) -> bool:
-        if series is None:
-            return True
-        val = series.iloc[i]
-        return bool(val) and not pd.isna(val)
-
-    for i in range(start, len(idx)):
-        t = idx[i]
-        if t > hard_deadline:
-            return TimeStopResult(idx=i, time=t, reason="max_hold")
-
-        if not (
-            _cond(vwap_side_ok, i)
-            and _cond(trend_ok, i)
-            and _cond(sigma_ok, i)
-            and _cond(dd_ok, i)
-        ):
-            return TimeStopResult(idx=i, time=t, reason="extension_break")
+    n = len(idx)
+    ok = np.ones(n - start, dtype=bool)
+    for series in (vwap_side_ok, trend_ok, sigma_ok, dd_ok):
+        if series is not None:
+            ok &= _truthy(series.to_numpy()[start:])
+
+    # The deadline is checked before the conditions, so when both fire on
+    # the same bar the exit is max_hold.
+    hard_i = max(int(np.searchsorted(ts_ns, hard_deadline_ns, side="right")), start)
+    brk = int((~ok).argmax())
+    break_i = start + brk if not ok[brk] else n
+
+    if hard_i < n and hard_i <= break_i:
+        return TimeStopResult(idx=hard_i, time=idx[hard_i], reason="max_hold")
+    if break_i < n:
+        return TimeStopResult(idx=break_i, time=idx[break_i], reason="extension_break")
 
     return TimeStopResult(idx=None, time=None, reason=None)
 
 
 def _first_stop_idx(
-    high: pd.Series,
-    low: pd.Series,
+    high: np.ndarray,
+    low: np.ndarray,
     stop_price: float,
     side: int,
     start_idx: int,
@@ -296,18 +315,15 @@ def _first_stop_idx(
         return None
 
     if side == 1:
-        mask = low.iloc[start_idx + 1 :] <= stop_price
+        mask = low[start_idx + 1 :] <= stop_price
     else:
-        mask = high.iloc[start_idx + 1 :] >= stop_price
-
-    if not mask.any():
-        return None
+        mask = high[start_idx + 1 :] >= stop_price
 
-    rel = np.flatnonzero(mask.to_numpy())
-    if len(rel) == 0:
+    rel = int(mask.argmax())
+    if not mask[rel]:
         return None
 
-    return start_idx + 1 + int(rel[0])
+    return start_idx + 1 + rel
 
 
 def manage_trade_lifecycle(
@@ -324,10 +340,17 @@ def manage_trade_lifecycle(
     sigma_ok: Optional[pd.Series] = None,
     dd_ok: Optional[pd.Series] = None,
     slippage_cfg: Any | None = None,
+    arrays: Optional[SessionArrays] = None,
 ) -> dict[str, Any]:
-    """Computes the complete outcome of a trade given full session data."""
-    high = bars["high"]
-    low = bars["low"]
+    """
+    Computes the complete outcome of a trade given full session data.
+
+    Callers managing several trades in one session can build ``arrays`` once
+    with ``SessionArrays.from_bars(bars)`` and pass it to every call.
+    """
+    if arrays is None:
+        arrays = SessionArrays.from_bars(bars)
+    high, low, close = arrays.high, arrays.low, arrays.close
     idx = bars.index
 
     def _exit_side(side_sign: int) -> Literal["long", "short"]:
@@ -375,6 +398,7 @@ def manage_trade_lifecycle(
         entry_price=entry_price,
         stop_price=stop_price,
         mgmt_cfg=mgmt_cfg,
+        arrays=arrays,
     )
 
     tp2_res = compute_tp2_target(
@@ -385,6 +409,7 @@ def manage_trade_lifecycle(
         stop_price=stop_price,
         mgmt_cfg=mgmt_cfg,
         refs=refs,
+        arrays=arrays,
     )
 
     ts_res = run_time_stop(
@@ -399,6 +424,7 @@ def manage_trade_lifecycle(
         trend_ok=trend_ok,
         sigma_ok=sigma_ok,
         dd_ok=dd_ok,
+        arrays=arrays,
     )
 
     def _earliest(
@@ -408,7 +434,7 @@ def manage_trade_lifecycle(
         if not valid:
             return None, None
         prio = {"stop": 0, "tp2": 1, "time_stop": 2, "tp1": 3}
-        label, i = sorted(valid, key=lambda x: (x[1], prio[x[0]]))[0]
+        label, i = min(valid, key=lambda x: (x[1], prio[x[0]]))
         return label, i
 
     earliest_label, earliest_idx = _earliest(
@@ -451,7 +477,7 @@ def manage_trade_lifecycle(
             reason = f"tp2_{tp2_res.label}"
         else:
             if earliest_idx is not None:
-                exit_price_raw = float(bars["close"].iloc[earliest_idx])
+                exit_price_raw = float(close[earliest_idx])
             else:
                 exit_price_raw = entry_price
             reason = ts_res.reason or "time_stop"
@@ -519,7 +545,7 @@ def manage_trade_lifecycle(
 
     if runner_label is None:
         runner_idx = len(idx) - 1
-        runner_exit_price_raw = float(bars["close"].iloc[runner_idx])
+        runner_exit_price_raw = float(close[runner_idx])
         runner_reason = "no_event"
     else:
         if runner_label == "stop":
@@ -530,7 +556,7 @@ def manage_trade_lifecycle(
             runner_reason = f"tp2_{tp2_res.label}"
         else:
             assert runner_ts_idx is not None
-            runner_exit_price_raw = float(bars["close"].iloc[int(runner_ts_idx)])
+            runner_exit_price_raw = float(close[int(runner_ts_idx)])
 
             runner_reason = runner_ts_reason
 
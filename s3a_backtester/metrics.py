@@ -161,7 +161,7 @@ def grouped_summary(trades: pd.DataFrame, by: str) -> pd.DataFrame:
         raise ValueError(f"Grouping column '{by}' not present/derivable")
 
     rows: list[dict[str, Any]] = []
-    for key, g in df.groupby(by, dropna=False):
+    for key, g in df.groupby(by, dropna=False, observed=True):
         s = summary(g)
         s[by] = str(key)
         rows.append(s)
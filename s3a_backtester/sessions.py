@@ -0,0 +1,52 @@
+"""
+Session Segmentation
+--------------------
+Shared wall-clock and per-session array primitives used by the feature,
+signal, filter and slippage code:
+- Wall-clock day number / time-of-day split of a DatetimeIndex.
+- Row offsets where a new session starts.
+- Cumulative sums that reset at every session start.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+def wall_day_tod(idx: pd.DatetimeIndex) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits an index into int64 wall-clock day numbers and ns-of-day in one
+    divmod, replacing `.date` / `.time` / `normalize()` object round-trips.
+    The index is converted to ns first: `asi8` counts in the index's unit.
+    """
+    wall = idx.tz_localize(None) if idx.tz is not None else idx
+    day, tod = np.divmod(wall.as_unit("ns").asi8, NS_PER_DAY)
+    return day, tod
+
+
+def session_starts(keys: np.ndarray) -> np.ndarray:
+    """Row positions where a new session begins (keys must be day-contiguous)."""
+    n = len(keys)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    change = np.empty(n, dtype=bool)
+    change[0] = True
+    change[1:] = keys[1:] != keys[:-1]
+    return np.flatnonzero(change)
+
+
+def session_cumsum(x: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum of `x` that resets at every offset in `starts`.
+    Equivalent to `groupby(session).cumsum()` for day-contiguous rows.
+    """
+    cs = np.cumsum(x)
+    if len(starts) == 0:
+        return cs
+    base = np.zeros(len(starts), dtype=cs.dtype)
+    base[1:] = cs[starts[1:] - 1]
+    out: np.ndarray = cs - np.repeat(base, np.diff(np.append(starts, len(x))))
+    return out
@@ -7,12 +7,13 @@ Differentiates between 'normal' trading hours and 'hot' windows (e.g., market op
 
 from __future__ import annotations
 
-from datetime import time as dtime
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 
-from .config import Config, SlippageCfg
+from .config import Config, SlippageCfg, parse_clock_ns
+from .sessions import wall_day_tod
 
 Side = Literal["long", "short"]
 
@@ -74,11 +75,14 @@ def _is_hot_window(ts: pd.Timestamp, slip_cfg: SlippageCfg) -> bool:
     else:
         ts_et = ts
 
-    t: dtime = ts_et.to_pydatetime().time()
+    t_ns = (
+        (ts_et.hour * 3600 + ts_et.minute * 60 + ts_et.second) * 1_000_000
+        + ts_et.microsecond
+    ) * 1_000 + ts_et.nanosecond
     try:
-        start: dtime = pd.Timestamp(slip_cfg.hot_start).to_pydatetime().time()
-        end: dtime = pd.Timestamp(slip_cfg.hot_end).to_pydatetime().time()
-        return bool(start <= t < end)
+        start = parse_clock_ns(slip_cfg.hot_start)
+        end = parse_clock_ns(slip_cfg.hot_end)
+        return bool(start <= t_ns < end)
     except ValueError:
         return False
 
@@ -106,3 +110,35 @@ def apply_slippage(
         return float(raw_price - ticks * tick_size)
 
     return float(raw_price)
+
+
+def apply_slippage_vec(
+    side_sign: np.ndarray,
+    ts: pd.DatetimeIndex,
+    raw_prices: np.ndarray,
+    cfg: Any | None = None,
+) -> np.ndarray:
+    """
+    Vectorized `apply_slippage` over many fills.
+    `side_sign` is +1 (long) / -1 (short); config is resolved once per call.
+    """
+    slip_cfg = _get_slip_cfg(cfg)
+    tick_size = _get_tick_size(cfg, slip_cfg)
+    prices = np.asarray(raw_prices, dtype=np.float64)
+
+    if slip_cfg.normal_ticks == 0 and slip_cfg.hot_ticks == 0:
+        return prices.copy()
+
+    ts_et = ts.tz_convert("America/New_York") if ts.tz is not None else ts
+    tod = wall_day_tod(ts_et)[1]
+    try:
+        start = parse_clock_ns(slip_cfg.hot_start)
+        end = parse_clock_ns(slip_cfg.hot_end)
+        hot = (tod >= start) & (tod < end)
+    except ValueError:
+        hot = np.zeros(len(prices), dtype=bool)
+
+    ticks = np.where(hot, slip_cfg.hot_ticks, slip_cfg.normal_ticks)
+    sign = np.sign(np.asarray(side_sign))
+    adjusted: np.ndarray = prices + sign * (ticks * tick_size)
+    return adjusted
@@ -1,6 +1,13 @@
 import pytest
 from dataclasses import dataclass, field
-from s3a_backtester.config import Config, load_config, RiskCfg, EntryWindow, SlippageCfg
+from s3a_backtester.config import (
+    Config,
+    load_config,
+    RiskCfg,
+    EntryWindow,
+    SlippageCfg,
+    parse_clock_ns,
+)
 from s3a_backtester.validator import validate_keys
 
 # --- 1. Validator Tests (The "Typos" Check) ---
@@ -117,3 +124,9 @@ def test_slippage_mode_validation():
     # This must fail
     with pytest.raises(ValueError, match="Invalid slippage mode"):
         SlippageCfg(mode="typo_mode")
+
+
+def test_parse_clock_ns():
+    """Clock strings map to nanoseconds since midnight (with or without seconds)."""
+    assert parse_clock_ns("09:35") == (9 * 3600 + 35 * 60) * 1_000_000_000
+    assert parse_clock_ns("11:00:30") == (11 * 3600 + 30) * 1_000_000_000
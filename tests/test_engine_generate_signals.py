@@ -242,3 +242,30 @@ def test_trend_5m_shift_prevents_lookahead():
     assert (out.loc[idx[:5], "trend_5m"] == 0).all()
     # 09:35-09:39 should see the completed 09:30-09:34 bar trend.
     assert (out.loc[idx[5:], "trend_5m"] == 1).all()
+
+
+def test_session_state_resets_each_day():
+    """Unlock / zone state must not carry over into the next session."""
+    day1 = _make_df([105.0] * 5 + [111.0, 108.0])
+    day2 = _make_df([105.0] * 7)
+    day2.index = day2.index + pd.Timedelta(days=1)
+    df = pd.concat([day1, day2])
+
+    out = generate_signals(df, cfg=MockWindowCfg)
+
+    assert out["unlocked"].iloc[6]
+    assert out["in_zone"].iloc[6]
+    assert not out["unlocked"].iloc[7:].any()
+    assert not out["in_zone"].iloc[7:].any()
+
+
+def test_time_window_on_non_ns_index():
+    """Entry-window gating must not depend on the index resolution."""
+    df = _make_df([105.0] * 5 + [111.0] + [105.0] * 4)
+    expected = generate_signals(df, cfg=MockWindowCfg)
+
+    out = generate_signals(df.set_axis(df.index.as_unit("us")), cfg=MockWindowCfg)
+
+    assert out["time_window_ok"].sum() == 5  # 09:35..09:39
+    assert out["time_window_ok"].tolist() == expected["time_window_ok"].tolist()
+    assert out["or_break_unlock"].iloc[5]
@@ -65,6 +65,13 @@ def test_simulate_valid_long_trade() -> None:
     assert t["side"] == "long"
     assert t["stop"] == 99.75
     assert t["trigger_type"] == "swingbreak"
+    assert isinstance(trades["trigger_type"].dtype, pd.CategoricalDtype)
+    assert list(trades["location"].cat.categories) == [
+        "none",
+        "vwap",
+        "+1sigma",
+        "-1sigma",
+    ]
 
 
 def test_simulate_risk_cap_block() -> None:
@@ -468,6 +475,7 @@ def test_lifecycle_bars_source_market_not_signals(monkeypatch) -> None:
         sigma_ok,
         dd_ok,
         slippage_cfg=None,
+        arrays=None,
     ):
         # ASSERT: OHLC comes from df1, not signals
         assert float(bars["open"].iloc[0]) == 100.0
@@ -533,3 +541,41 @@ def test_exit_slippage_applied_to_stop() -> None:
 
     assert len(trades) == 1
     assert trades.iloc[0]["slippage_exit_ticks"] == -2.0
+
+
+def test_nullable_flag_columns_treat_na_as_false() -> None:
+    """Nullable `boolean` flags with <NA> must gate like False, not raise."""
+    dates = pd.date_range("2024-01-01 09:30", periods=3, freq="1min")
+    df = pd.DataFrame(
+        {
+            "open": [100.0, 105.0, 110.0],
+            "close": [100.0, 105.0, 110.0],
+            "high": [100.0, 105.0, 110.0],
+            "low": [100.0, 105.0, 110.0],
+        },
+        index=dates,
+    )
+
+    signals = df.copy()
+    signals["direction"] = 1
+    signals["trigger_ok"] = pd.array([True, pd.NA, False], dtype="boolean")
+    signals["time_window_ok"] = pd.array([True, True, True], dtype="boolean")
+    signals["disqualified_2sigma"] = pd.array([pd.NA, False, False], dtype="boolean")
+    signals["stop_price"] = 90.0
+
+    cfg = Config(slippage=SlippageCfg(mode="close", tick_size=0.0))
+    trades = simulate_trades(df, signals, cfg)
+
+    assert len(trades) == 1
+    assert trades.iloc[0]["signal_time"] == dates[0]
+
+
+def test_empty_result_has_typed_schema_and_is_a_fresh_copy() -> None:
+    empty = simulate_trades(pd.DataFrame(), pd.DataFrame(), cfg=None)
+
+    assert list(empty.columns) == eng._TRADE_COLS
+    assert empty["realized_R"].dtype == "float64"
+
+    empty["realized_R"] = empty["realized_R"].astype("int64")
+    again = simulate_trades(pd.DataFrame(), pd.DataFrame(), cfg=None)
+    assert again["realized_R"].dtype == "float64"
@@ -113,3 +113,103 @@ def test_or_lookahead_prevention() -> None:
 
     # Check Persistence (09:40) -> MUST BE VALID
     assert res.loc[dates[10], "or_high"] == expected_high, "OR High lost at 09:40"
+
+
+def test_find_swings_last_price_resets_each_session() -> None:
+    prices = [10, 11, 12, 15, 12, 11, 10]
+    day1 = pd.date_range("2023-01-02 09:30", periods=len(prices), freq="1min")
+    day2 = pd.date_range("2023-01-03 09:30", periods=len(prices), freq="1min")
+    df = pd.DataFrame(
+        {"high": prices * 2, "low": prices * 2, "close": prices * 2},
+        index=day1.append(day2),
+    )
+    df.iloc[7:, :] = 10  # flat second session -> no pivots
+
+    res = find_swings_1m(df, lb=1, rb=1)
+
+    assert res["last_swing_high_price"].iloc[6] == 15.0
+    assert res["last_swing_high_price"].iloc[7:].isna().all()
+
+
+def test_compute_session_refs_is_per_session() -> None:
+    day1 = pd.date_range("2023-01-02 09:30", periods=8, freq="1min")
+    day2 = pd.date_range("2023-01-03 09:30", periods=8, freq="1min")
+    df = pd.DataFrame(
+        {"high": [105.0] * 8 + [210.0] * 8, "low": [95.0] * 8 + [190.0] * 8},
+        index=day1.append(day2),
+    )
+
+    res = compute_session_refs(df)
+
+    assert res["or_high"].iloc[5] == 105.0
+    assert res["or_height"].iloc[7] == 10.0
+    assert pd.isna(res["or_high"].iloc[8])
+    assert res["or_high"].iloc[13] == 210.0
+    assert res["or_height"].iloc[15] == 20.0
+
+
+def test_compute_session_vwap_bands_resets_each_session() -> None:
+    day1 = pd.date_range("2023-01-02 09:28", periods=5, freq="1min")
+    day2 = pd.date_range("2023-01-03 09:30", periods=3, freq="1min")
+    df = pd.DataFrame(
+        {
+            "close": [1.0, 1.0, 100.0, 102.0, 104.0, 200.0, 202.0, 204.0],
+            "volume": [1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 2.0],
+        },
+        index=day1.append(day2),
+    )
+
+    res = compute_session_vwap_bands(df)
+
+    assert res["vwap"].iloc[:2].isna().all()  # before 09:30
+    assert res["vwap"].iloc[4] == (100.0 + 102.0 + 2 * 104.0) / 4
+    assert res["vwap_sd"].iloc[2] == 0.0
+    assert np.isclose(res["vwap_sd"].iloc[4], 2.0)
+    assert res["vwap"].iloc[5] == 200.0
+    assert np.isclose(res["vwap"].iloc[7], (200.0 + 202.0 + 2 * 204.0) / 4)
+
+
+def test_feature_helpers_handle_non_ns_index() -> None:
+    # Sessions must split on wall-clock days whatever the index resolution.
+    days = [
+        pd.date_range(
+            f"2024-01-0{d} 09:30", periods=25, freq="1min", tz="America/New_York"
+        )
+        for d in (2, 3, 4)
+    ]
+    idx = days[0].append(days[1]).append(days[2])
+    rng = np.random.default_rng(7)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, len(idx)))
+    df = pd.DataFrame(
+        {
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": 10.0,
+        },
+        index=idx,
+    )
+
+    for unit in ("us", "ms", "s"):
+        df_u = df.set_axis(idx.as_unit(unit))
+        for fn in (compute_session_refs, compute_session_vwap_bands, find_swings_1m):
+            np.testing.assert_array_equal(
+                fn(df_u).to_numpy(dtype=float), fn(df).to_numpy(dtype=float)
+            )
+
+    res = compute_session_vwap_bands(df.set_axis(idx.as_unit("us")))
+    assert np.isclose(res["vwap"].iloc[25], df["close"].iloc[25])
+
+
+def test_feature_helpers_do_not_add_columns_to_input() -> None:
+    dates = pd.date_range("2023-01-02 09:30", periods=10, freq="1min")
+    df = pd.DataFrame(
+        {"high": 101.0, "low": 99.0, "close": 100.0, "volume": 10.0}, index=dates
+    )
+    cols = list(df.columns)
+
+    compute_session_refs(df)
+    compute_session_vwap_bands(df)
+    find_swings_1m(df)
+
+    assert list(df.columns) == cols
@@ -57,6 +57,21 @@ def test_filter_news_blackout() -> None:
     assert mask.iloc[2]  # Allowed
 
 
+def test_filter_sessions_on_non_ns_index() -> None:
+    # Intraday bars on a us index must still split into separate days.
+    idx = pd.date_range("2024-01-01 09:30", periods=3, freq="D").repeat(2)
+    idx = (idx + pd.to_timedelta([0, 60] * 3, unit="s")).as_unit("us")
+    df = pd.DataFrame(
+        {"or_high": 10.0, "or_low": 0.0, "atr15": 5.0, "news_blackout": False},
+        index=idx,
+    )
+    df.loc[idx[2], "news_blackout"] = True
+
+    mask = build_session_filter_mask(df, filters_cfg=MockFilterCfg)
+
+    assert mask.tolist() == [True, True, False, False, True, True]
+
+
 def test_atr_lookahead_bias() -> None:
     """
     CRITICAL TEST: Verifies that the Session Filter does NOT use today's EOD ATR
@@ -15,6 +15,7 @@ from s3a_backtester.management import (
     compute_tp2_target,
     run_time_stop,
     manage_trade_lifecycle,
+    SessionArrays,
 )
 from s3a_backtester.config import MgmtCfg, TimeStopCfg
 
@@ -123,6 +124,25 @@ def test_time_stop_extension_break(session_df):
     assert res.idx == 20
 
 
+def test_time_stop_extension_break_on_nan_condition(session_df):
+    # A missing condition value counts as "not ok" and breaks the extension.
+    sigma_ok = pd.Series(1.0, index=session_df.index)
+    sigma_ok.iloc[12] = float("nan")
+    cfg = TimeStopCfg(mode="15m", allow_extension=True)
+    res = run_time_stop(
+        session_df,
+        entry_idx=0,
+        tp1_idx=5,
+        side=1,
+        entry_price=100,
+        stop_price=99,
+        time_cfg=cfg,
+        sigma_ok=sigma_ok,
+    )
+    assert res.reason == "extension_break"
+    assert res.idx == 12
+
+
 def test_time_stop_max_hold(session_df):
     # If using extension logic, it exits the minute AFTER deadline
     cfg = TimeStopCfg(mode="15m", max_holding_min=45, allow_extension=True)
@@ -140,6 +160,33 @@ def test_time_stop_max_hold(session_df):
     assert res.idx == 46
 
 
+def test_time_stop_on_non_ns_index(session_df):
+    # Deadlines are in ns, so a us/ms index must be normalised first.
+    bars = session_df.set_axis(session_df.index.as_unit("us"))
+    no_tp1 = run_time_stop(
+        bars,
+        entry_idx=0,
+        tp1_idx=None,
+        side=1,
+        entry_price=100,
+        stop_price=99,
+        time_cfg=TimeStopCfg(mode="15m", tp1_timeout_min=15),
+    )
+    assert (no_tp1.idx, no_tp1.reason) == (15, "no_tp1_15m")
+
+    max_hold = run_time_stop(
+        bars,
+        entry_idx=0,
+        tp1_idx=5,
+        side=1,
+        entry_price=100,
+        stop_price=99,
+        time_cfg=TimeStopCfg(mode="15m", max_holding_min=45, allow_extension=False),
+        arrays=SessionArrays.from_bars(bars),
+    )
+    assert (max_hold.idx, max_hold.reason) == (45, "max_hold")
+
+
 def test_lifecycle_runner_stopped_at_be(session_df):
     # Entry @ 2. TP1 @ 5. Stop moves to BE (100).
     # IMPORTANT: Keep prices > 100 between TP1 and Stop Hit to prevent early exit.
@@ -170,3 +217,26 @@ def test_lifecycle_runner_stopped_at_be(session_df):
 
     assert res["realized_R"] == pytest.approx(0.5)
     assert res["exit_idx"] == 10
+
+
+def test_lifecycle_with_shared_session_arrays(session_df):
+    # Precomputed session arrays must give the same outcome as deriving them.
+    session_df.loc[session_df.index[5], "high"] = 101.5
+    session_df.loc[session_df.index[30], "high"] = 102.5
+    m_cfg = MgmtCfg(tp1_R=1.0, tp2_R=2.5, scale_at_tp1=0.5)
+    t_cfg = TimeStopCfg(mode="15m", max_holding_min=45)
+    kwargs = dict(
+        entry_idx=0,
+        side=1,
+        entry_price=100.5,
+        stop_price=99.5,
+        mgmt_cfg=m_cfg,
+        time_cfg=t_cfg,
+        refs={"or_height": 2.0},
+    )
+
+    shared = manage_trade_lifecycle(
+        session_df, arrays=SessionArrays.from_bars(session_df), **kwargs
+    )
+    assert shared == manage_trade_lifecycle(session_df, **kwargs)
+    assert shared["tp2_label"] == "measured_move"
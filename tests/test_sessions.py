@@ -0,0 +1,36 @@
+"""
+Tests for s3a_backtester.sessions
+---------------------------------
+Coverage:
+- Wall-clock day / time-of-day split (tz-aware, non-ns units).
+- Session start offsets and per-session cumulative sums.
+"""
+
+import numpy as np
+import pandas as pd
+from s3a_backtester.sessions import session_cumsum, session_starts, wall_day_tod
+
+
+def test_wall_day_tod_is_unit_independent() -> None:
+    idx = pd.DatetimeIndex(
+        ["2024-01-02 09:30", "2024-01-02 23:59", "2024-01-03 00:00"]
+    ).tz_localize("America/New_York")
+
+    day, tod = wall_day_tod(idx)
+    assert day[1] == day[0] and day[2] == day[0] + 1
+    assert tod[0] == (9 * 3600 + 30 * 60) * 1_000_000_000
+
+    for unit in ("us", "ms", "s"):
+        day_u, tod_u = wall_day_tod(idx.as_unit(unit))
+        np.testing.assert_array_equal(day_u, day)
+        np.testing.assert_array_equal(tod_u, tod)
+
+
+def test_session_cumsum_resets_at_starts() -> None:
+    keys = np.array([5, 5, 5, 6, 6, 9])
+    starts = session_starts(keys)
+    assert starts.tolist() == [0, 3, 5]
+
+    flags = np.array([True, False, True, True, True, False])
+    assert session_cumsum(flags, starts).tolist() == [1, 1, 2, 1, 2, 0]
+    assert session_starts(np.array([], dtype=np.int64)).size == 0
@@ -7,8 +7,9 @@ Verifies:
 - Tick size math.
 """
 
+import numpy as np
 import pandas as pd
-from s3a_backtester.slippage import apply_slippage
+from s3a_backtester.slippage import apply_slippage, apply_slippage_vec
 from s3a_backtester.config import Config, SlippageCfg
 
 
@@ -59,3 +60,42 @@ def test_no_config_defaults():
     # Case 2: Default Config object
     cfg = Config()
     assert apply_slippage("long", ts, 100.0, cfg) == 100.25
+
+
+def test_slippage_vec_matches_scalar():
+    """The batched path must agree with the scalar path fill-for-fill."""
+    slip_cfg = SlippageCfg(normal_ticks=1, hot_ticks=3, tick_size=0.25)
+    cfg = Config(slippage=slip_cfg)
+
+    ts = pd.DatetimeIndex(
+        ["2023-01-03 14:30:00", "2023-01-03 14:39:00", "2023-01-03 17:00:00"],
+        tz="UTC",
+    )
+    sides = np.array([1, -1, 1])
+    prices = np.array([100.0, 100.0, 100.0])
+
+    out = apply_slippage_vec(sides, ts, prices, cfg)
+
+    expected = [
+        apply_slippage("long" if s > 0 else "short", t, p, cfg)
+        for s, t, p in zip(sides, ts, prices)
+    ]
+    assert out.tolist() == expected
+    assert apply_slippage_vec(sides, ts, prices, None).tolist() == prices.tolist()
+
+
+def test_slippage_vec_on_non_ns_index():
+    """Hot-window detection must not depend on the timestamp resolution."""
+    slip_cfg = SlippageCfg(normal_ticks=1, hot_ticks=3, tick_size=0.25)
+    cfg = Config(slippage=slip_cfg)
+
+    ts = pd.DatetimeIndex(
+        ["2023-01-03 14:30:00", "2023-01-03 14:39:00", "2023-01-03 17:00:00"],
+        tz="UTC",
+    ).as_unit("us")
+    sides = np.array([1, -1, 1])
+    prices = np.array([100.0, 100.0, 100.0])
+
+    out = apply_slippage_vec(sides, ts, prices, cfg)
+
+    assert out.tolist() == [100.75, 99.25, 100.25]